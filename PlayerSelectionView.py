@@ -1,5 +1,7 @@
 import arcade
-from driver import GameView
+import arcade.gui
+from engine.eventlog import event_log
+from textures import registry, start_preloading
 
 class PlayerSelectionView(arcade.View):
     def __init__(self):
@@ -30,7 +32,7 @@ class PlayerSelectionView(arcade.View):
         # Loop through characters and create buttons, then add them to rows
         for i, (character_name, character_image) in enumerate(self.characters):
             button = arcade.gui.UITextureButton(
-                texture=arcade.load_texture(character_image),
+                texture=registry.get(character_image),
                 width=200,
                 height=300,
             )
@@ -71,15 +73,29 @@ class PlayerSelectionView(arcade.View):
             )
         )
 
+        # How much of the game has loaded, changed as the preloader goes
+        self.loading_text = arcade.Text("", self.window.width / 2, 20,
+                                        arcade.color.GRAY, font_size=12, anchor_x="center")
+        self.preloader = start_preloading()
+
+    def on_update(self, delta_time):
+        # Pick up the images the preloader has read
+        self.preloader.collect()
+        text = f"Loading game: {self.preloader.progress:.0%}" if self.preloader.progress < 1 else ""
+        if self.loading_text.text != text:
+            self.loading_text.text = text
+
     def on_character_select(self, button, character_name):
         # Store the selected button for the outline
         self.selected_button = button
         self.window.character_name = character_name
-        print(f"Character selected: {character_name}")
+        event_log.info(character_name, "select")
 
     def on_next_button_click(self, event):
         # Move to game if player selected
         if self.selected_button != None:
+            from GameView import GameView
+
             game_view = GameView()
             self.window.show_view(game_view)
 
@@ -94,5 +110,7 @@ class PlayerSelectionView(arcade.View):
             arcade.draw_rectangle_outline(x, y, self.selected_button.width + 10, self.selected_button.height + 10,
                                           color=arcade.color.YELLOW, border_width=5)
 
+        self.loading_text.draw()
+
     def on_hide_view(self):
         self.manager.disable()
\ No newline at end of file
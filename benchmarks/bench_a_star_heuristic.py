@@ -0,0 +1,111 @@
+"""
+Count the nodes A* expands between every pair of rooms: the original search
+heading for one door with the Manhattan heuristic, against the new search
+heading for every door of the room, first with the Manhattan heuristic and
+then with the heuristic built from the distances around the walls.
+
+Run from the repository root:
+    python benchmarks/bench_a_star_heuristic.py
+"""
+import heapq
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import Board
+
+REPEAT = 5
+
+
+def manhattan(current, goals):
+    """The old Board.heuristic, Manhattan distance to the nearest goal"""
+    return min(abs(current[0] - goal[0]) + abs(current[1] - goal[1]) for goal in goals)
+
+
+def original_a_star(board, start, goal):
+    """
+    The search a_star replaced: one goal, the Manhattan heuristic, ties broken
+    by position and stale queue entries expanded again.
+    Returns the path and the number of nodes expanded
+    """
+    expansions = 0
+    open_list = [(0, start)]
+    came_from = {}
+    g_score = {start: 0}
+
+    while open_list:
+        _, current = heapq.heappop(open_list)
+        expansions += 1
+        if current == goal:
+            return board.reconstruct_path(came_from, current), expansions
+
+        for neighbor in board.get_neighbors(current, start, goal):
+            tentative_g_score = g_score[current] + 1
+            if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                heapq.heappush(open_list, (tentative_g_score + manhattan(neighbor, (goal,)), neighbor))
+    return None, expansions
+
+
+def best_time(statement, number):
+    """Return the best time per call in microseconds"""
+    return min(timeit.repeat(statement, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def main():
+    board = Board()
+    rooms = [room.name for room in board.rooms if room.accessible]
+
+    # Start inside every room, just through its first door, and head for every other room
+    pairs = [(board.get_doors(start)[0].get_room_entry_position(), start, goal)
+             for start in rooms for goal in rooms if start != goal]
+
+    def search(start, goal, heuristic):
+        """Return the path length and nodes expanded by one search"""
+        board.heuristic = heuristic
+        path = board.a_star(start, goal)
+        del board.heuristic
+        return len(path) - 1, board.expansions
+
+    print(f"{'':<30}{'one door':>18}{'every door':>18}{'door-aware':>18}")
+    print(f"{'':<30}" + f"{'steps':>9}{'expanded':>9}" * 3)
+
+    totals = [0, 0, 0]
+    for start, start_room, goal_room in pairs:
+        door = board.get_doors(goal_room)[0].boundaries
+        doors = [door.boundaries for door in board.get_doors(goal_room)]
+        path, expanded = original_a_star(board, start, door)
+        results = [(len(path) - 1, expanded),
+                   search(start, doors, manhattan),
+                   search(start, doors, board.heuristic)]
+
+        # The door-aware heuristic must still find the shortest way to the room
+        assert results[2][0] == results[1][0] <= results[0][0], (start_room, goal_room)
+
+        line = f"{start_room + ' to ' + goal_room:<30}"
+        for column, (steps, expanded) in enumerate(results):
+            line += f"{steps:>9}{expanded:>9}"
+            totals[column] += expanded
+        print(line)
+
+    print(f"\n{'Total expanded':<30}" + "".join(f"{total:>18}" for total in totals))
+    print(f"{'Reduction from one door':<30}" + "".join(f"{totals[0] / total:>17.1f}x" for total in totals))
+
+    # Time every pair with the original search and the new one
+    def run_original():
+        for start, _, goal_room in pairs:
+            original_a_star(board, start, board.get_doors(goal_room)[0].boundaries)
+
+    def run_door_aware():
+        for start, _, goal_room in pairs:
+            board.a_star(start, [door.boundaries for door in board.get_doors(goal_room)])
+
+    print(f"{'Time, one door (us)':<30}{best_time(run_original, 1):>18.2f}")
+    print(f"{'Time, door-aware (us)':<30}{best_time(run_door_aware, 1):>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare A* with doors looked up through the board's door index against the
+old scans over every door in Board.can_move.
+
+Run from the repository root:
+    python benchmarks/bench_door_index.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import Board, ROW_COUNT, COLUMN_COUNT
+
+REPEAT = 5
+
+
+def scan_can_move(board, current, direction, start, goal):
+    """Board.can_move as it was before the door index, scanning every door twice"""
+    row, col = current
+    next_position = {
+        "UP": (row + 1, col),
+        "DOWN": (row - 1, col),
+        "LEFT": (row, col - 1),
+        "RIGHT": (row, col + 1),
+    }.get(direction)
+
+    opposites = {"UP": "DOWN",
+                 "DOWN": "UP",
+                 "LEFT": "RIGHT",
+                 "RIGHT": "LEFT"}
+
+    current_room = board.get_room(current)
+    next_room = board.get_room(next_position)
+    start_room = board.get_room(start)
+    goal_room = board.get_room(goal)
+
+    if not (0 <= next_position[0] < ROW_COUNT and 0 <= next_position[1] < COLUMN_COUNT):
+        return False
+
+    if board.is_occupied(next_position):
+        return False
+
+    for door in board.doors:
+        if (row, col) == door.boundaries and door.entry_direction == direction and next_room == goal_room:
+            return True
+
+    for door in board.doors:
+        if (next_position[0], next_position[1]) == door.boundaries and door.entry_direction == opposites[direction]:
+            return True
+
+    if current_room == next_room and (next_room == start_room or next_room == goal_room or next_room == None):
+        return True
+
+    return False
+
+
+def best_time(statement, number):
+    """Return the best time per call in microseconds"""
+    return min(timeit.repeat(statement, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def report(name, scan, index):
+    print(f"{name:<34}{scan:>12.2f}{index:>12.2f}{scan / index:>9.1f}x")
+
+
+def main():
+    board = Board()
+
+    # A* between every pair of doors
+    door_pairs = [(start.boundaries, goal.boundaries) for start in board.doors for goal in board.doors
+                  if start is not goal]
+
+    def run_a_star():
+        return [board.a_star(start, goal) for start, goal in door_pairs]
+
+    # Make sure both versions find the same paths before timing anything
+    index_paths = run_a_star()
+    board.can_move = lambda *args: scan_can_move(board, *args)
+    scan_paths = run_a_star()
+    del board.can_move
+    assert index_paths == scan_paths
+
+    print(f"{'':<34}{'scan (us)':>12}{'index (us)':>12}{'speedup':>10}")
+
+    index = best_time(run_a_star, 1)
+    board.can_move = lambda *args: scan_can_move(board, *args)
+    scan = best_time(run_a_star, 1)
+    del board.can_move
+    report(f"a_star ({len(door_pairs)} door pairs)", scan, index)
+
+    # A single A* search across the board, Lounge door to Conservatory door
+    index = best_time(lambda: board.a_star((17, 17), (4, 5)), 20)
+    board.can_move = lambda *args: scan_can_move(board, *args)
+    scan = best_time(lambda: board.a_star((17, 17), (4, 5)), 20)
+    del board.can_move
+    report("a_star (Lounge to Conservatory)", scan, index)
+
+
+if __name__ == "__main__":
+    main()
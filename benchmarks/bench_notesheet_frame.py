@@ -0,0 +1,127 @@
+"""
+Measure the time to draw one frame of the notesheet and the instruction
+screen as they are now, with text kept in arcade.Text objects and the grid
+in a sprite list and shape list, against drawing the same text, cells and
+rectangles one call at a time every frame as the screens used to.
+
+Run from the repository root (set PYGLET_HEADLESS=1 where there's no display):
+    python benchmarks/bench_notesheet_frame.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arcade
+
+from engine import CARD_IDS, Notes, SUSPECTS, WEAPONS, ROOMS
+from InstructionView import InstructionView, INSTRUCTIONS
+from notesheet import (Notesheet, NOTESHEET_COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, GRID_CELL_SIZE,
+                       TEXT_AREA_WIDTH, TEXT_AREA_HEIGHT)
+
+FRAMES = 200
+FRAME_BUDGET = 1000 / 60
+
+
+def immediate_notesheet_text(notesheet):
+    """The text Notesheet.on_draw used to lay out every frame"""
+    arcade.draw_text("Notesheet", 50, SCREEN_HEIGHT - 25, arcade.color.BLACK, 16, anchor_x="center")
+    for title, items in (("Suspects", SUSPECTS), ("Weapons", WEAPONS), ("Rooms", ROOMS)):
+        start_x, start_y = notesheet.get_grid_start_position(title)
+        arcade.draw_text(title, start_x, start_y, arcade.color.BLACK, 16, anchor_x="left")
+        y_offset = start_y - 30
+        for item in items:
+            arcade.draw_text(item, start_x, y_offset, arcade.color.BLACK, 12, anchor_x="left")
+            y_offset -= 60
+    arcade.draw_text("Enter notes here:", 50, SCREEN_HEIGHT // 2 - 60, arcade.color.BLACK, 12)
+
+
+def immediate_notesheet_shapes(notesheet):
+    """The cells and rectangles Notesheet.on_draw used to draw one at a time every frame"""
+    for section, items in (("Suspects", SUSPECTS), ("Weapons", WEAPONS), ("Rooms", ROOMS)):
+        start_x, start_y = notesheet.get_grid_start_position(section)
+        for index, item in enumerate(items):
+            cell_x = start_x + 150
+            cell_y = start_y - 30 - index * 60 + 10
+            color = NOTESHEET_COLORS[notesheet.notes.get(notesheet.seat, CARD_IDS[item])]
+            arcade.draw_rectangle_filled(cell_x, cell_y, GRID_CELL_SIZE, GRID_CELL_SIZE, color)
+            arcade.draw_rectangle_outline(cell_x, cell_y, GRID_CELL_SIZE, GRID_CELL_SIZE, arcade.color.BLACK)
+    arcade.draw_rectangle_filled(450, 200, 175, 200, arcade.color.BLACK)
+    arcade.draw_rectangle_outline(50 + TEXT_AREA_WIDTH // 2, (SCREEN_HEIGHT // 2 - 275) + TEXT_AREA_HEIGHT // 2,
+                                  TEXT_AREA_WIDTH + 5, TEXT_AREA_HEIGHT + 5, arcade.color.BLACK, border_width=2)
+
+
+def immediate_instruction_text(window):
+    """The text InstructionView.on_draw used to lay out every frame"""
+    arcade.draw_text("Instructions", window.width / 2, window.height - 60,
+                     arcade.color.WHITE, font_size=40, anchor_x="center")
+    start_y = window.height - 120
+    for i, line in enumerate(INSTRUCTIONS):
+        arcade.draw_text(line, window.width / 2, start_y - i * 25,
+                         arcade.color.LIGHT_GRAY, font_size=16, anchor_x="center")
+    arcade.draw_text("Click to start", window.width / 2, 30, arcade.color.WHITE, font_size=18, anchor_x="center")
+
+
+def frame_times(window, draw):
+    """Return the time of every frame in milliseconds, waiting for the GPU to finish each one"""
+    # a few frames first so fonts and shaders are loaded
+    for _ in range(10):
+        draw()
+    window.ctx.finish()
+
+    times = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        draw()
+        window.ctx.finish()
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)
+
+
+def report(name, times):
+    mean = sum(times) / len(times)
+    worst = times[int(len(times) * 0.99) - 1]
+    print(f"{name:<34}{mean:>10.3f}{worst:>10.3f}{1000 / mean:>10.0f}"
+          f"{'yes' if worst < FRAME_BUDGET else 'no':>10}")
+
+
+def main():
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "Frame time", visible=False)
+    notesheet = Notesheet(None, "N/A", True, Notes(4))
+    instructions = InstructionView()
+
+    def retained_notesheet():
+        notesheet.on_draw()
+
+    def old_notesheet(retained_text):
+        # the frame as it was, every cell and rectangle drawn on its own
+        arcade.start_render()
+        immediate_notesheet_shapes(notesheet)
+        if retained_text:
+            notesheet.title_text.draw()
+            for text in notesheet.grid_texts:
+                text.draw()
+            notesheet.notes_label_text.draw()
+        else:
+            immediate_notesheet_text(notesheet)
+        notesheet.mark_text.draw()
+        notesheet.suggest_text.draw()
+        notesheet.accuse_text.draw()
+        notesheet.manager.draw()
+
+    def old_instructions():
+        window.clear()
+        immediate_instruction_text(window)
+
+    print(f"{'':<34}{'mean (ms)':>10}{'p99 (ms)':>10}{'fps':>10}{'60 fps':>10}")
+    report("notesheet, draw_text", frame_times(window, lambda: old_notesheet(False)))
+    report("notesheet, retained text", frame_times(window, lambda: old_notesheet(True)))
+    report("notesheet, retained", frame_times(window, retained_notesheet))
+    report("instructions, draw_text", frame_times(window, old_instructions))
+    report("instructions, retained", frame_times(window, instructions.on_draw))
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
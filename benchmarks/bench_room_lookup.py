@@ -0,0 +1,96 @@
+"""
+Compare room lookups through the compiled room grid against the old linear
+scan over every room boundary.
+
+Run from the repository root:
+    python benchmarks/bench_room_lookup.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board import Board, ROW_COUNT, COLUMN_COUNT, NO_ROOM
+from player import Player
+
+PIECE_IMAGE = "assets/board game pieces/PNG/Pieces (Red)/pieceRed_border00.png"
+REPEAT = 5
+
+
+def linear_get_room(rooms, position):
+    """The room lookup Board.get_room used before the room grid existed"""
+    row, col = position
+    for room in rooms:
+        for row_start, row_end, col_start, col_end in room.boundaries:
+            if row_start <= row <= row_end and col_start <= col <= col_end:
+                return room.name
+    return None
+
+
+def linear_get_room_id(rooms, position):
+    """Room index lookup built on the old linear scan"""
+    name = linear_get_room(rooms, position)
+    return NO_ROOM if name is None else [room.name for room in rooms].index(name)
+
+
+def best_time(statement, number):
+    """Return the best time per call in microseconds"""
+    return min(timeit.repeat(statement, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def report(name, linear, grid):
+    print(f"{name:<28}{linear:>12.2f}{grid:>12.2f}{linear / grid:>9.1f}x")
+
+
+def main():
+    board = Board()
+    squares = [(row, col) for row in range(ROW_COUNT) for col in range(COLUMN_COUNT)]
+
+    # Make sure the grid agrees with the old scan before timing anything
+    for position in squares:
+        assert board.get_room(position) == linear_get_room(board.rooms, position), position
+
+    print(f"{'':<28}{'linear (us)':>12}{'grid (us)':>12}{'speedup':>10}")
+
+    # Room lookup over every square on the board
+    linear = best_time(lambda: [linear_get_room(board.rooms, square) for square in squares], 50)
+    grid = best_time(lambda: [board.get_room(square) for square in squares], 50)
+    report("get_room (576 squares)", linear, grid)
+
+    # A* between every pair of doors
+    door_pairs = [(start.boundaries, goal.boundaries) for start in board.doors for goal in board.doors
+                  if start is not goal]
+
+    def run_a_star():
+        for start, goal in door_pairs:
+            board.a_star(start, goal)
+
+    grid = best_time(run_a_star, 1)
+    board.get_room = lambda position: linear_get_room(board.rooms, position)
+    linear = best_time(run_a_star, 1)
+    del board.get_room
+    report(f"a_star ({len(door_pairs)} door pairs)", linear, grid)
+
+    # A lap of key presses for the player piece, out of and back into the Lounge
+    player = Player(PIECE_IMAGE, "Miss Scarlet", 0.4, 18, 17, board.board_size,
+                    board.board_center_x, board.board_center_y)
+    keys = ["DOWN", "DOWN", "LEFT", "RIGHT", "UP", "UP"]
+    deltas = {"UP": (1, 0), "DOWN": (-1, 0), "LEFT": (0, -1), "RIGHT": (0, 1)}
+
+    def run_moves():
+        player.row, player.column = 18, 17
+        player.reset_room_entry_flag()
+        for key in keys:
+            d_row, d_column = deltas[key]
+            player.move(d_row, d_column, board, key)
+
+    grid = best_time(run_moves, 200)
+    board.get_room_id = lambda position: linear_get_room_id(board.rooms, position)
+    linear = best_time(run_moves, 200)
+    del board.get_room_id
+    report(f"Player.move ({len(keys)} keys)", linear, grid)
+
+
+if __name__ == "__main__":
+    main()
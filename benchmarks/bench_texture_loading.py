@@ -0,0 +1,50 @@
+"""
+Compare loading every image the game shows, one file per image, against
+cutting them out of the sprite sheets, counting the files read from disk.
+
+Run from the repository root:
+    python benchmarks/bench_texture_loading.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arcade
+
+from textures import TextureRegistry, add_game_sheets, game_texture_files
+
+REPEAT = 5
+
+
+def load_all(sheets):
+    """Load every game image into a new registry, returning it and the time taken in milliseconds"""
+    # arcade keeps its own cache of the files it loaded, start from nothing every time
+    arcade.cleanup_texture_cache()
+    textures = TextureRegistry()
+    if sheets:
+        add_game_sheets(textures)
+    start = time.perf_counter()
+    for file_name in game_texture_files():
+        textures.get(file_name)
+    return textures, (time.perf_counter() - start) * 1000
+
+
+def main():
+    files, _ = load_all(False)
+    sheets, _ = load_all(True)
+
+    # The pieces were loaded with hit boxes from their pixels, the sheets keep that
+    for file_name in game_texture_files():
+        assert files.get(file_name).size == sheets.get(file_name).size, file_name
+
+    print(f"{'':<20}{'images':>10}{'files read':>12}{'time (ms)':>12}")
+    for name, use_sheets in (("one file per image", False), ("sprite sheets", True)):
+        best = min(load_all(use_sheets)[1] for _ in range(REPEAT))
+        textures = load_all(use_sheets)[0]
+        print(f"{name:<20}{len(game_texture_files()):>10}{textures.stats()['opened']:>12}{best:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
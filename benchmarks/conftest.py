@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+# Benchmarks import the game's modules and read its assets relative to the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Save every run as JSON under .benchmarks/, named after the commit it was run
+    # on, to compare commits with --benchmark-compare. Only with pytest-benchmark
+    # installed, without it the suite is skipped
+    if config.pluginmanager.hasplugin("benchmark") and not config.option.benchmark_autosave:
+        from pytest_benchmark.utils import get_tag
+        config.option.benchmark_autosave = get_tag()
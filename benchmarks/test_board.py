@@ -0,0 +1,22 @@
+"""
+Check that a_star takes a goal as one position or any collection of
+positions. Doesn't need pytest-benchmark.
+
+Run from the repository root:
+    python -m pytest benchmarks/test_board.py
+"""
+import pytest
+
+from engine import Board
+
+
+@pytest.mark.parametrize("collection", [list, tuple, set, frozenset])
+def test_a_star_goal_collections(collection):
+    board = Board()
+    start = board.get_doors("Study")[0].get_room_entry_position()
+    doors = [door.boundaries for door in board.get_doors("Kitchen")]
+
+    nearest = min((board.a_star(start, door) for door in doors), key=len)
+    path = board.a_star(start, collection(doors))
+    assert len(path) == len(nearest)
+    assert path[-1] in doors
@@ -0,0 +1,137 @@
+"""
+pytest-benchmark suite over the engine's hot paths: pathfinding, room lookup,
+dealing, refuting suggestions, saving the notesheet and snapshotting a game. Nothing here opens a
+window, so it runs headless.
+
+Run from the repository root, every run is saved as JSON under .benchmarks/:
+    python -m pytest benchmarks
+Compare against the last saved run, failing if anything got 10% slower:
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+import itertools
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from engine import (Board, CARD_COUNT, Deck, Game, Notes, NotesheetBox, ROW_COUNT, COLUMN_COUNT, OFF,
+                    SUSPECT_CARD_VALUES, WEAPON_CARD_VALUES, ROOM_CARD_VALUES, event_log,
+                    restore_game, snapshot_game)
+
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+# Every suggestion a player can make
+SUGGESTIONS = list(itertools.product(SUSPECT_CARD_VALUES, WEAPON_CARD_VALUES, ROOM_CARD_VALUES))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def quiet_log():
+    # Keep the event log (the unrefuted suggestion, a game's moves) off the
+    # console while timing, then put its level back
+    level = event_log.level
+    event_log.set_level(OFF)
+    yield
+    event_log.set_level(level)
+
+
+@pytest.fixture(scope="module")
+def board():
+    return Board()
+
+
+@pytest.fixture(scope="module")
+def dealt_deck():
+    deck = Deck()
+    deck.deal(4, random.Random(0))
+    return deck
+
+
+def test_a_star_door_pairs(benchmark, board):
+    door_pairs = [(start.boundaries, goal.boundaries) for start in board.doors for goal in board.doors
+                  if start is not goal]
+
+    paths = benchmark(lambda: [board.a_star(start, goal) for start, goal in door_pairs])
+    assert all(paths)
+
+
+def test_get_room_every_square(benchmark, board):
+    squares = [(row, col) for row in range(ROW_COUNT) for col in range(COLUMN_COUNT)]
+
+    rooms = benchmark(lambda: [board.get_room(square) for square in squares])
+    assert len(rooms) == 576
+    # The nine rooms plus the middle of the board and the squares outside it
+    assert set(ROOM_CARD_VALUES) < set(rooms)
+
+
+def test_can_move_every_square(benchmark, board):
+    # Every step a search towards the Lounge door could try
+    start, goal = (0, 0), (17, 17)
+    steps = [((row, col), direction) for row in range(ROW_COUNT) for col in range(COLUMN_COUNT)
+             for direction in DIRECTIONS]
+
+    benchmark(lambda: [board.can_move(current, direction, start, goal) for current, direction in steps])
+
+
+def test_deal(benchmark):
+    def deal():
+        deck = Deck()
+        deck.deal(4, random.Random(0))
+        return deck
+
+    deck = benchmark(deal)
+    assert sorted(card.card_type for card in deck.get_killer()) == ["Rooms", "Suspects", "Weapons"]
+    assert sum(len(hand) for hand in deck.get_all_cards()) == 18
+
+
+def test_refute_every_suggestion(benchmark, dealt_deck):
+    decks = dealt_deck.get_all_cards()
+
+    refuted = benchmark(lambda: [dealt_deck.refute_guess(suggestion, decks, None)[0] for suggestion in SUGGESTIONS])
+    assert len(refuted) == 324
+    assert refuted.count(False) == 1
+
+
+def test_notesheet_round_trip(benchmark, monkeypatch, tmp_path):
+    pytest.importorskip("arcade")
+    from notesheet import Notesheet
+
+    # save_notes and load_notes only touch the notes and the text area, so
+    # they run on a stand-in without making the sheet's sprites and widgets
+    sheet = SimpleNamespace(text_area=SimpleNamespace(text="Mustard has the rope?"), notes=Notes(4), seat=0,
+                            refresh_cells=lambda: None)
+    for card_id in range(CARD_COUNT):
+        sheet.notes.set(0, card_id, list(NotesheetBox)[card_id % len(NotesheetBox)])
+    notes = sheet.notes.copy()
+
+    # The save files are written to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    def round_trip():
+        Notesheet.save_notes(sheet)
+        Notesheet.load_notes(sheet)
+
+    benchmark(round_trip)
+    assert sheet.notes.boxes == notes.boxes
+    assert sheet.text_area.text == "Mustard has the rope?"
+
+
+@pytest.fixture(scope="module")
+def game_in_progress():
+    game = Game(seed=5)
+    for _ in range(8):
+        game.play_round()
+    return game
+
+
+def test_snapshot(benchmark, game_in_progress):
+    data = benchmark(snapshot_game, game_in_progress)
+    assert len(data) < 512
+
+
+def test_restore(benchmark, game_in_progress):
+    data = snapshot_game(game_in_progress)
+
+    game = benchmark(restore_game, data)
+    assert snapshot_game(game) == data
@@ -0,0 +1,102 @@
+"""
+Cross-check PathPlanner against a breadth-first search. One planner per room
+is kept across many calls from random hallway squares with random pieces in
+the way, the way an AI's planner is kept across turns, and every path must be
+a shortest path around the pieces. Also checks planning a round of AI moves.
+Doesn't need pytest-benchmark.
+
+Run from the repository root:
+    python -m pytest benchmarks/test_planner.py
+"""
+import random
+from collections import deque
+
+import pytest
+
+from engine import Board, Game, PathPlanner, NO_ROOM, OFF, ROW_COUNT, COLUMN_COUNT, event_log
+
+CALLS_PER_ROOM = 1000
+
+
+@pytest.fixture
+def quiet_log():
+    level = event_log.level
+    event_log.set_level(OFF)
+    yield
+    event_log.set_level(level)
+
+
+def shortest_distance(neighbors, start, goals, blocked):
+    """Return the fewest hallway steps from start to any of goals, or None"""
+    distances = {start: 0}
+    frontier = deque([start])
+    while frontier:
+        node = frontier.popleft()
+        if node in goals:
+            return distances[node]
+        for neighbor in neighbors[node]:
+            if neighbor not in blocked and neighbor not in distances:
+                distances[neighbor] = distances[node] + 1
+                frontier.append(neighbor)
+    return None
+
+
+@pytest.mark.parametrize("room", [room.name for room in Board().rooms if room.accessible])
+def test_planner_matches_bfs(room):
+    board = Board()
+    neighbors = board.topology.hallway_neighbors
+    hallway = [row * COLUMN_COUNT + col for row in range(ROW_COUNT) for col in range(COLUMN_COUNT)
+               if board.get_room_id((row, col)) == NO_ROOM and neighbors[row * COLUMN_COUNT + col]]
+    goals = [door.boundaries for door in board.get_doors(room)]
+    goal_nodes = {row * COLUMN_COUNT + col for row, col in goals}
+
+    planner = PathPlanner(board, goals)
+    rng = random.Random(room)
+    for _ in range(CALLS_PER_ROOM):
+        start = rng.choice(hallway)
+        # a handful of pieces, the same ones often enough that some calls only move the start
+        blocked = set(rng.sample(hallway, rng.randrange(6))) if rng.random() < 0.5 else planner.blocked - {start}
+        blocked.discard(start)
+
+        path = planner.path(divmod(start, COLUMN_COUNT), blocked=blocked)
+        expected = shortest_distance(neighbors, start, goal_nodes, blocked)
+        if expected is None:
+            assert path is None
+            continue
+        assert path is not None and len(path) == expected, (room, divmod(start, COLUMN_COUNT), sorted(blocked))
+
+        # every step is to a free square next to the last, ending on a door
+        node = start
+        for row, col in path:
+            assert row * COLUMN_COUNT + col in neighbors[node]
+            node = row * COLUMN_COUNT + col
+            assert node not in blocked
+        assert node in goal_nodes
+
+
+def test_plan_round_leaves_pieces_in_place(quiet_log):
+    # Play until AIs are setting off from rooms, planning a round mustn't move
+    # anyone out of their room before their turn
+    game = Game(seed=3)
+    for _ in range(20):
+        locations = {name: tuple(square) for name, square in game.board.player_locations.items()}
+        game.plan_round()
+        assert {name: tuple(square) for name, square in game.board.player_locations.items()} == locations
+        assert set(game.round_plan) == set(range(game.num_players))
+        game.play_round()
+        if game.game_over:
+            break
+        assert not game.round_plan
+
+
+def test_pieces_never_share_a_square(quiet_log):
+    # AIs leave their rooms by a free door, or wait, so no two pieces are ever
+    # on the same hallway square
+    for seed in range(100):
+        game = Game(seed=seed)
+        while not game.game_over and game.turn_count < 500:
+            game.play_ai_turn()
+            game.next_turn()
+            squares = [tuple(square) for square in game.board.player_locations.values()
+                       if game.board.get_room_id(square) == NO_ROOM]
+            assert len(squares) == len(set(squares)), (seed, game.turn_count)
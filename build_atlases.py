@@ -0,0 +1,61 @@
+import os
+import xml.etree.ElementTree as ElementTree
+
+import PIL.Image
+
+import engine
+from textures import CARD_BACK_IMAGE, GAME_SHEET, PIECE_IMAGES, card_image
+
+# Width of the game sheet, six cards across
+SHEET_WIDTH = 648
+
+
+def write_descriptor(descriptor, regions):
+    """
+    Write a TextureAtlas XML descriptor, in the format of the bundled ones,
+    for the (x, y, width, height) of every image on a sheet by name
+    """
+    root = ElementTree.Element("TextureAtlas", imagePath=os.path.basename(os.path.splitext(descriptor)[0] + ".png"))
+    for name, (x, y, width, height) in regions.items():
+        ElementTree.SubElement(root, "SubTexture", name=name, x=str(x), y=str(y), width=str(width), height=str(height))
+    ElementTree.indent(root, space="\t")
+    ElementTree.ElementTree(root).write(descriptor, encoding="unicode")
+
+
+def build_sheet(descriptor, file_names, width):
+    """
+    Pack images into one sheet no wider than width, in rows in the order
+    given, and write it with its descriptor. Images are named on the sheet
+    by their path from the descriptor's directory
+    """
+    directory = os.path.dirname(descriptor)
+    regions = {}
+    images = []
+    x = y = row_height = 0
+    for file_name in file_names:
+        image = PIL.Image.open(file_name).convert("RGBA")
+        if x + image.width > width:
+            # start a new row
+            x, y, row_height = 0, y + row_height, 0
+        regions[os.path.relpath(file_name, directory)] = (x, y, image.width, image.height)
+        images.append((image, (x, y)))
+        x += image.width
+        row_height = max(row_height, image.height)
+
+    sheet = PIL.Image.new("RGBA", (width, y + row_height))
+    for image, position in images:
+        sheet.paste(image, position)
+    sheet.save(os.path.splitext(descriptor)[0] + ".png", optimize=True)
+    write_descriptor(descriptor, regions)
+    print(f"{descriptor}: {len(regions)} images, {sheet.width}x{sheet.height}")
+
+
+def main():
+    # Every card face and the back, then the piece of every character
+    card_values = engine.SUSPECT_CARD_VALUES + engine.WEAPON_CARD_VALUES + engine.ROOM_CARD_VALUES
+    file_names = [card_image(value) for value in card_values] + [CARD_BACK_IMAGE] + list(PIECE_IMAGES.values())
+    build_sheet(GAME_SHEET, file_names, SHEET_WIDTH)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,30 @@
 import arcade
-import random
 
-class Die(arcade.Sprite):
-    def __init__(self, scale):
+import engine
+from textures import registry, die_image
+
+
+class Die(engine.Die, arcade.Sprite):
+    def __init__(self, scale, animation_rng):
         # Initialize die value and set initial image filename
-        self.value = 1
-        self.final_value = 1
-        self.image_filename = f"assets/board game pieces/PNG/Dice/dieWhite_border{self.value}.png"
+        engine.Die.__init__(self)
+
+        # The faces shown while rolling come from their own stream, so the
+        # animation never changes what's rolled
+        self.animation_rng = animation_rng
+        self.image_filename = die_image(self.value)
         self.roll_counter = 0
         self.is_rolling = False
-        self.spaces_remaining = self.final_value
-        super().__init__(self.image_filename, scale, hit_box_algorithm="None", center_x=675, center_y=125)
+        arcade.Sprite.__init__(self, scale=scale, center_x=675, center_y=125, texture=registry.get(self.image_filename))
 
-    def roll(self):
+    def show(self, value):
         """
-        Start the rolling animation
+        Start the rolling animation, the value rolled is returned straight
+        away and shown once the animation finishes
         """
         self.is_rolling = True
         self.roll_counter = 0
+        return super().show(value)
 
     def update_animation(self):
         """
@@ -26,12 +33,11 @@ class Die(arcade.Sprite):
         if self.is_rolling:
             if self.roll_counter < 6:
                 # Set a random face during the roll animation
-                self.value = random.randint(1, 6)
-                self.texture = arcade.load_texture(f"assets/board game pieces/PNG/Dice/dieWhite_border{self.value}.png")
+                self.value = self.animation_rng.randint(1, 6)
+                self.texture = registry.get(die_image(self.value))
                 self.roll_counter += 1
             else:
                 # Set the final value and texture
-                self.final_value = random.randint(1, 6)
-                self.texture = arcade.load_texture(f"assets/board game pieces/PNG/Dice/dieWhite_border{self.final_value}.png")
-                self.spaces_remaining = self.final_value
-                self.is_rolling = False  
\ No newline at end of file
+                self.value = self.final_value
+                self.texture = registry.get(die_image(self.final_value))
+                self.is_rolling = False
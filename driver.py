@@ -1,710 +1,104 @@
-from player import Player
-from board import Board
-from deck import Deck
-from die import Die
-from notesheet import Notesheet
-from computer import Computer
-import random
-import arcade
-import arcade.gui
-import os
+import argparse
+import atexit
+import sys
+import time
+from contextlib import contextmanager
 
 # Screen dimensions
 SCREEN_WIDTH = 750
 SCREEN_HEIGHT = 750
 SCREEN_TITLE = "Clue Game"
 
-# Font Styling
-DEFAULT_FONT_SIZE = 20
+# Modules of the game, to show which ones were loaded by the first frame
+GAME_MODULES = ("InstructionView", "PlayerSelectionView", "GameView", "GameOverView", "notesheet",
+                "board", "deck", "die", "player", "computer", "textures", "engine", "arcade.gui")
 
 
-class GameView(arcade.View):
+class StartupProfile:
     def __init__(self):
-        super().__init__()
-        self.setup()
-
-    def setup(self):
         """
-        Set up the application.
+        Time each step of starting up, in the order they happen
         """
-        self.window.suspect = None
-        self.window.weapon = None
-        self.window.room = None
-        self.window.guess_method = None
-
-        # Create the board
-        self.board = Board()
-        self.board_size = self.board.board_size
-        self.board_center_x = self.board.board_center_x
-        self.board_center_y = self.board.board_center_y
-        self.background_texture = self.board.background_texture
-
-        # Keep track of whose turn it currently is
-        self.whose_turn = [True, False, False, False] # User, AI1, AI2, AI3
-        self.ai_turn_completed = False
-
-
-        # Create the player piece
-        piece_scale = 0.4
-        player_selection = {
-            "Miss Scarlet": ["assets/board game pieces/PNG/Pieces (Red)/pieceRed_border00.png", 23, 16],
-            "Colonel Mustard": ["assets/board game pieces/PNG/Pieces (Yellow)/pieceYellow_border18.png", 16, 23],
-            "Mrs. White": ["assets/board game pieces/PNG/Pieces (White)/pieceWhite_border00.png", 23, 7],
-            "Mr. Green": ["assets/board game pieces/PNG/Pieces (Green)/pieceGreen_border00.png", 6, 23],
-            "Mrs. Peacock": ["assets/board game pieces/PNG/Pieces (Blue)/pieceBlue_border01.png", 5, 0],
-            "Professor Plum": ["assets/board game pieces/PNG/Pieces (Purple)/piecePurple_border00.png", 18, 0]
-        }
-
-        # Get selected players sprite and starting coordinates
-        piece_image, starting_x, starting_y = player_selection[self.window.character_name]
-        self.player_piece = Player(piece_image, self.window.character_name, piece_scale, starting_x, starting_y,
-                                   self.board_size, self.board_center_x, self.board_center_y)
-        del player_selection[self.window.character_name]
-        
-        # Create ai 1
-        self.ai_card_1_name, ai_card_1_info = random.choice(list(player_selection.items()))
-        piece_image, starting_x, starting_y = ai_card_1_info
-        self.ai_1 = Computer(piece_image, self.ai_card_1_name, piece_scale, starting_x, starting_y,
-                                   self.board_size, self.board_center_x, self.board_center_y)
-        del player_selection[self.ai_card_1_name]
-
-        # Create ai 2
-        self.ai_card_2_name, ai_card_2_info = random.choice(list(player_selection.items()))
-        piece_image, starting_x, starting_y = ai_card_2_info
-        self.ai_2 = Computer(piece_image, self.ai_card_2_name, piece_scale, starting_x, starting_y,
-                                   self.board_size, self.board_center_x, self.board_center_y)
-        del player_selection[self.ai_card_2_name]
-
-        # Create ai 3
-        self.ai_card_3_name, ai_card_3_info = random.choice(list(player_selection.items()))
-        piece_image, starting_x, starting_y = ai_card_3_info
-        self.ai_3 = Computer(piece_image, self.ai_card_3_name, piece_scale, starting_x, starting_y,
-                                   self.board_size, self.board_center_x, self.board_center_y)
-        del player_selection[self.ai_card_3_name]
-
-        # Create a die for each player
-        self.die = Die(1.25)
-        self.spaces_remaining = 0
-        self.player_spaces_remaining = 0
-
-        # Create the deck and deal out the cards
-        self.deck = Deck()
-        self.num_players = 4
-        self.deck.deal(self.num_players)
-        self.all_decks = self.deck.get_all_cards()
-        self.refute_card = None
-        self.killer = self.deck.get_killer()
-
-        self.card_padding_from_board = 20
-        self.card_padding_from_cards = 20
-        self.card_padding_from_edge = 20
-
-        self.ai_1_accuse_cards = []
-        self.ai_2_accuse_cards = []
-        self.ai_3_accuse_cards = []
-
-        # Create pop up window for AI suggestions
-        popup_text_x = SCREEN_HEIGHT / 2
-        popup_text_y = SCREEN_WIDTH / 2
-        self.popup_text = arcade.Text(
-            "AI Guess",
-            popup_text_x,
-            popup_text_y,
-            arcade.color.WHITE,
-            font_size=14,
-            multiline=True,
-            width=200,
-            anchor_x="center",
-            anchor_y="center"
-        )
-        self.popup_enabled = False
-
-        # Position cards on the screen
-        for deck in self.all_decks:
-            num_player_cards_set = 0
-
-            # Horizontal position for each AI card is the same, the board's padding
-            # plus the board size plus the padding from the board
-            horizontal_pos = self.board.padding + self.board.board_size + self.card_padding_from_board
-
-            # Vertical position for each player card is the same, the screen height minus the board's padding
-            # minus the board size minus the padding from the board
-            vertical_pos = SCREEN_HEIGHT - self.board.padding - self.board.board_size - self.card_padding_from_board
-
-            for card in deck:
-                # Player's cards, horizontal position is the padding from the edge plus half the card's width since
-                # we're calculating the card's center. Added to this is the spacing for a card's width and padding times
-                # the number of cards seen, so they'll space themselves out. Vertical positioning is the position
-                # discussed earlier plus half the card height
-                if deck == self.all_decks[0]:
-                    card.position = (self.card_padding_from_edge + card.card_width // 2 + num_player_cards_set * (card.card_width + self.card_padding_from_cards),
-                                     vertical_pos - card.card_height // 2)
-                    num_player_cards_set += 1
-                # First AI player cards, horizontal position is the position discussed earlier plus half the card width
-                # since we're calculating the center of each card. Vertical position is the screen height
-                # (since origin is in the bottom), minus half the card height and the padding from the edge
-                elif deck == self.all_decks[1]:
-                    card.position = (horizontal_pos + card.card_width // 2,
-                                     SCREEN_HEIGHT - card.card_height // 2 - self.card_padding_from_edge)
-                # Move down a card by adding in the card height and padding between cards
-                elif deck == self.all_decks[2]:
-                    card.position = (horizontal_pos + card.card_width // 2,
-                                     SCREEN_HEIGHT - card.card_height // 2 - self.card_padding_from_edge - card.card_height - self.card_padding_from_cards)
-                # Move down 2 cards by adding in 2 card heights and padding between 2 cards
-                elif deck == self.all_decks[3]:
-                    card.position = (horizontal_pos + card.card_width // 2,
-                                     SCREEN_HEIGHT - card.card_height // 2 - self.card_padding_from_edge - 2 * card.card_height - 2 * self.card_padding_from_cards)
-                # Move down 3 cards by adding in 3 card heights and padding between 3 cards
-                elif deck == self.all_decks[4]:
-                    card.position = (horizontal_pos + card.card_width // 2,
-                                     SCREEN_HEIGHT - card.card_height // 2 - self.card_padding_from_edge - 3 * card.card_height - 3 * self.card_padding_from_cards)
-                # Move down 4 cards by adding in 4 card heights and padding between 4 cards
-                elif deck == self.all_decks[5]:
-                    card.position = (horizontal_pos + card.card_width // 2,
-                                     SCREEN_HEIGHT - card.card_height // 2 - self.card_padding_from_edge - 4 * card.card_height - 4 * self.card_padding_from_cards)
-
-        # Create the note sheet
-        self.notesheet_view = Notesheet(self, self.player_piece.get_room(self.board.rooms), self.whose_turn[0])
-        self.notesheet_view.set_ai_cards(self.all_decks[1], self.all_decks[2], self.all_decks[3])
-
-        # Delete the ai's old note sheet if it exists
-        ai_save_file = "ai_notesheet_state.json"
-        if os.path.exists(ai_save_file):
-            os.remove(ai_save_file)
-
-        # Save new AI note sheet file
-        self.notesheet_view.save_notes()
-
-        # List for all sprites
-        self.all_sprites = arcade.SpriteList()
-        self.all_sprites.append(self.player_piece)
-        self.all_sprites.extend([self.ai_1, self.ai_2, self.ai_3])
-
-        # Append each die individually to self.all_sprites
-        self.all_sprites.append(self.die)
-        for player_deck in self.all_decks:
-            for card in player_deck:
-                self.all_sprites.append(card)
-
-        # Create UI manager for buttons and notesheet
-        self.ui_manager = arcade.gui.UIManager()
-        self.ui_manager.enable()
-
-        # Render buttons
-        self.default_style = {
-            "font_name": ("calibri", "arial"),
-            "font_size": 15,
-            "font_color": arcade.color.WHITE,
-            "border_width": 2,
-            "border_color": None,
-            "bg_color": arcade.color.RASPBERRY,
-        }
-
-        # Create a button layout
-        self.h_box = arcade.gui.UIBoxLayout(vertical=False)
-
-        # Create the notesheet button
-        self.notesheet_button = arcade.gui.UIFlatButton(text="Notesheet", width=200, style=self.default_style)
-        self.h_box.add(self.notesheet_button.with_space_around(right=60))
-        self.notesheet_button.on_click = self.on_click_notesheet
-
-        # Create the roll button
-        self.roll_button = arcade.gui.UIFlatButton(text="Roll", width=200, style=self.default_style)
-        self.h_box.add(self.roll_button.with_space_around(left=80))
-        self.roll_button.on_click = self.on_click_roll
-        self.roll_disabled = False
-
-        # Create the text for the disabled roll "button"
-        disabled_roll_text_x = 426
-        disabled_roll_text_y = 31
-        self.disabled_roll_text = arcade.Text(
-            "Roll",
-            disabled_roll_text_x,
-            disabled_roll_text_y,
-            arcade.color.WHITE,
-            font_size=15,
-            font_name=("calibri", "arial")
-        )
-
-        self.guessed_this_turn = False
+        self.steps = []
 
-        # Create the text for how many spaces remaining
-        spaces_left_text_x = 565
-        spaces_left_text_y = 30
-        self.spaces_left_text = arcade.Text(
-            f"Spaces Left: {self.player_spaces_remaining}",
-            spaces_left_text_x,
-            spaces_left_text_y,
-            arcade.color.WHITE,
-            DEFAULT_FONT_SIZE
-        )
+    @contextmanager
+    def step(self, name):
+        start = time.perf_counter()
+        yield
+        self.steps.append((name, time.perf_counter() - start))
 
-        # Create the text for when no one can help you
-        no_help_text_x = 220
-        no_help_text_y = 45
-        self.no_help_text = arcade.Text(
-            "No one can\nhelp you",
-            no_help_text_x,
-            no_help_text_y,
-            arcade.color.WHITE,
-            font_size=14,
-            multiline=True,
-            width=150,
-        )
-        self.show_no_help = False
-
-        # Position the buttons 
-        self.ui_manager.add(
-            arcade.gui.UIAnchorWidget(
-                anchor_x="center_x",
-                align_x=-100,
-                anchor_y="center_y",
-                align_y=-335,
-                child=self.h_box)
-        )
-
-    def on_show_view(self):
-        from GameOverView import GameOverView
-
-        self.ui_manager.enable()
-        if self.whose_turn[0] == True:
-            try:
-                if self.window.suspect is not None and self.window.weapon is not None and self.window.room is not None:
-                    self.player_spaces_remaining = 0
-                    self.suspect = self.window.suspect
-                    self.weapon = self.window.weapon
-                    self.room = self.window.room
-                    guess_members = [self.suspect, self.weapon, self.room]
-                    if self.window.guess_method == 0:
-                        flipped = False
-                        for deck in self.all_decks:
-                            if flipped:
-                                break
-                            for card in deck:
-                                if card.value in guess_members and card not in self.all_decks[0]:
-                                    self.refute_card = card
-                                    self.flip_refute_card(card)
-                                    self.refute_card = card
-                                    flipped = True
-                                    break
-                        if flipped:
-                            self.show_no_help = False
-                        else:
-                            self.show_no_help = True
-                    elif self.window.guess_method == 1:
-                        won = True
-                        killer_values = []
-                        for answer in self.killer:
-                            killer_values.append(answer.value)
-                        for guess in guess_members:
-                            if guess not in killer_values:
-                                won = False
-                        game_over_view = GameOverView(won)
-                        self.window.show_view(game_over_view)
-            except AttributeError:
-                pass
-        
-
-    # A function to flip an AI's card face down after they have refuted your guess
-    def on_mouse_press(self, x, y, button, key_modifiers):
-        # Close pop up if it's open
-        if self.popup_enabled:
-            self.popup_enabled = False
-
-        # Check if the user clicked on a face_up refute card
-        cards = arcade.get_sprites_at_point((x, y), self.all_sprites)
-
-        # If they did, flip it face down again and reset the refute_card
-        if self.refute_card in cards:
-            self.refute_card.face_down()
-            self.refute_card = None
-            self.next_turn()
-
-    def flip_refute_card(self, card):
-        # Flip card upright
-        card.face_up()
-
-        # Move card to back of the sprites list
-        self.all_sprites.remove(card)
-        self.all_sprites.append(card)
-
-    def on_click_roll(self, event):
-        """
-        Handle roll for user
-        """
-        if not self.roll_disabled and self.whose_turn[0]:
-            if self.player_spaces_remaining == 0:
-                current_die = self.die
-                current_die.roll()
-                # Wait for rolling to finish before updating spaces
-                arcade.schedule(self.update_spaces_after_roll, 0.1)
-                self.roll_disabled = True
-
-    def update_spaces_after_roll(self, delta_time):
-        """
-        Update spaces_remaining after die roll animation completes.
-        """
-        if not self.die.is_rolling:
-            self.player_spaces_remaining = self.die.spaces_remaining
-            self.spaces_left_text.text = f"Spaces Left: {self.player_spaces_remaining}"
-            arcade.unschedule(self.update_spaces_after_roll)
-
-    def roll_die_for_current_player(self):
+    def report(self):
         """
-        Roll the die for the current player. Use specific logic for each AI player.
+        Print the time of every step and the total, and the game modules loaded so far
         """
-        current_player_index = self.whose_turn.index(True)
-
-        if current_player_index == 0:
-            # Enable roll button 
-            self.roll_disabled = False
-
-        # AI Players
-        else:
-            current_ai = [self.ai_1, self.ai_2, self.ai_3][current_player_index - 1]
-
-            if self.spaces_remaining == 0:
-                self.roll_disabled = True
-                self.die.roll()
-                current_ai.spaces_remaining = self.die.value
-
-                print(f"{current_ai.character_name} rolled a {current_ai.spaces_remaining}")
-
-                # If the AI is currently in a room and has spaces to move, exit the room
-                if current_ai.within_a_room(self.board.rooms):
-                    print(f"{current_ai.character_name} is inside a room and will attempt to exit.")
-                    for door in self.board.doors:
-                        if door.room_name == current_ai.get_room(self.board.rooms):
-                            current_ai.move(door.boundaries)
-                            current_ai.spaces_remaining -= 1
-                            print(f"{current_ai.character_name} exited the room to {door.boundaries}")
-                            break
+        total = sum(seconds for _, seconds in self.steps)
+        for name, seconds in self.steps:
+            print(f"{name:<28}{seconds * 1000:>10.1f} ms{seconds / total:>8.0%}")
+        print(f"{'Total':<28}{total * 1000:>10.1f} ms")
+        loaded = [name for name in GAME_MODULES if name in sys.modules]
+        print(f"Game modules loaded: {', '.join(loaded)}")
 
-                # if no goal or the goal is reached, select a new goal
-                if current_ai.goal is None or current_ai.has_reached_goal(self.board):
-                    # select a new random goal room
-                    goal_row, goal_col, goal_room = self.board.get_random_goal()
-                    current_ai.goal = (goal_row, goal_col, goal_room)
-                    print(f"{current_ai.character_name} selected a new goal: {goal_room} at ({goal_row}, {goal_col})")
-                    
-                # use the existing goal
-                goal_row, goal_col, goal_room = current_ai.goal
-                print(f"{current_ai.character_name} is heading to {goal_room} at ({goal_row}, {goal_col})")
-               
-                # calculate path using A* algorithm
-                start = (current_ai.row, current_ai.column)
-                path = self.board.a_star(start, (goal_row, goal_col))
-                if path:
-                    print(f"Path found for {current_ai.character_name}: {path}")
-
-                # move the AI along the path
-                while current_ai.spaces_remaining > 0 and path:
-                    next_step = path.pop(0)
-                    current_ai.move(next_step)
-                    current_ai.spaces_remaining -= 1
-                    self.board.player_locations[current_ai.character_name] = [current_ai.row, current_ai.column]
-
-                    # check if AI is at the door
-                    if (current_ai.row, current_ai.column) == (goal_row, goal_col):
-                        # find the door and determine the room entry position
-                        for door in self.board.doors:
-                            if door.boundaries == (goal_row, goal_col):
-                                room_entry = door.get_room_entry_position()
-                                print(f"{current_ai.character_name} is entering {goal_room} at {room_entry}")
-                                current_ai.move(room_entry)  # move into the room
-                                current_ai.spaces_remaining = 0  # stop further movement
-                                break
-                
-                # if the AI has reached its goal, clear the goal
-                if current_ai.has_reached_goal(self.board):
-                    print(f"{current_ai.character_name} has entered {goal_room}.")
-                    current_ai.goal = None
-
-    def on_click_notesheet(self, event):
-        """
-        Switch to Notesheet view when button is clicked.
-        """
-        self.ui_manager.disable()
-        if self.refute_card:
-            self.notesheet_view.update_notesheet(False, self.player_piece.get_room(self.board.rooms))
-        else:
-            self.notesheet_view.update_notesheet(self.whose_turn[0], self.player_piece.get_room(self.board.rooms))
-        self.window.show_view(self.notesheet_view)
-
-    def on_draw(self):
-        """
-        Render the screen.
-        """
-        # Clear the screen
-        self.clear()
-        arcade.set_background_color(arcade.color.BLACK)
-
-
-        # Draw the Clue board in the center of the window
-        arcade.draw_texture_rectangle(self.board_center_x, self.board_center_y,
-                                      self.board_size, self.board_size,
-                                      self.background_texture)
-
-        # Draw the player's piece on the board and the cards
-        self.all_sprites.draw()
-
-        # Draw UI elements
-        self.ui_manager.draw()
-
-        # If roll is disabled, draw over it
-        if self.roll_disabled:
-            arcade.draw_rectangle_filled(self.roll_button.center_x, self.roll_button.center_y,
-                                     200, 50, arcade.color.GRAY)
-            self.disabled_roll_text.draw()
-
-        if self.player_spaces_remaining != 0:
-            self.spaces_left_text.draw()
-
-
-        card_width = 81
-        card_height = 93
-        padding_from_card = 10
-        triangle_x1 = self.board.padding + self.board.board_size + self.card_padding_from_board + card_width + padding_from_card
-        triangle_y1 = SCREEN_HEIGHT - self.card_padding_from_edge - card_height // 2
-        triangle_x2 = triangle_x1 + 15
-        triangle_y2 = triangle_y1 + 15
-        triangle_x3 = triangle_x1 + 15
-        triangle_y3 = triangle_y1 - 15
-        if self.whose_turn[0]:
-            pass
-        else:
-            offset_factor = 1
-            for i in range(0, len(self.whose_turn)):
-                if self.whose_turn[i]:
-                    offset_factor = i - 1
-            vertical_offset = offset_factor * (card_height + self.card_padding_from_cards)
-            arcade.draw_triangle_filled(triangle_x1, triangle_y1 - vertical_offset,
-                                        triangle_x2, triangle_y2 - vertical_offset,
-                                        triangle_x3, triangle_y3 - vertical_offset,
-                                        arcade.color.GREEN)
-
-        if self.show_no_help:
-            self.no_help_text.draw()
-
-        # Show AI pop up if they make a suggestion
-        if self.popup_enabled:
-            self.ui_manager.disable()
-            arcade.draw_rectangle_filled(SCREEN_HEIGHT / 2, SCREEN_WIDTH / 2,
-                                        250, 150, arcade.color.BLACK)
-            self.popup_text.draw()
-        else:
-            self.ui_manager.enable()
-
-    def on_key_press(self, key, modifiers):
-        """
-        Handle player movement using arrow keys.
-        """
-        if key == arcade.key.ESCAPE:
-            arcade.close_window()
-            arcade.exit()
-
-        elif key == arcade.key.ENTER:
-            self.next_turn()
-
-        if self.player_spaces_remaining > 0:
-            last_row = self.player_piece.row
-            last_col = self.player_piece.column
-            if key == arcade.key.UP:
-                self.player_piece.move(1, 0, self.board.rooms, self.board.doors, self.board.player_locations, key)
-                self.update_spaces_left(last_row, last_col)
-                self.spaces_left_text.text = f"Spaces Left: {self.player_spaces_remaining}"
-            elif key == arcade.key.DOWN:
-                self.player_piece.move(-1, 0, self.board.rooms, self.board.doors, self.board.player_locations, key)
-                self.update_spaces_left(last_row, last_col)
-                self.spaces_left_text.text = f"Spaces Left: {self.player_spaces_remaining}"
-            elif key == arcade.key.LEFT:
-                self.player_piece.move(0, -1, self.board.rooms, self.board.doors, self.board.player_locations, key)
-                self.update_spaces_left(last_row, last_col)
-                self.spaces_left_text.text = f"Spaces Left: {self.player_spaces_remaining}"
-            elif key == arcade.key.RIGHT:
-                self.player_piece.move(0, 1, self.board.rooms, self.board.doors, self.board.player_locations, key)
-                self.update_spaces_left(last_row, last_col)
-                self.spaces_left_text.text = f"Spaces Left: {self.player_spaces_remaining}"
-            if self.player_spaces_remaining == 0:
-                self.next_turn()
-
-    def next_turn(self):
-        """
-        Handle player turns
-        """
-
-        if self.whose_turn[0]:
-            self.player_spaces_remaining = 0
-            self.spaces_remaining = 0
-            self.show_no_help = False
-            self.roll_disabled = True
-            self.player_piece.reset_room_entry_flag()
-            if self.refute_card:
-                self.refute_card.face_down()
-                self.refute_card = None
-            self.whose_turn[0] = False
-            self.whose_turn[1] = True
-
-        # AI 1 turn
-        elif self.whose_turn[1]:
-            self.whose_turn[1] = False
-            self.whose_turn[2] = True
-
-        # AI 2 turn
-        elif self.whose_turn[2]:
-            self.whose_turn[2] = False
-            self.whose_turn[3] = True
-
-        # AI 3 turn
-        elif self.whose_turn[3]:
-            self.whose_turn[3] = False
-            self.whose_turn[0] = True
-            self.roll_disabled = False
-
-        # Reset spaces for the next player
-        self.player_spaces_remaining = 0
-        self.spaces_remaining = 0 
-        # Reset AI turn state
-        self.ai_turn_completed = False
-
-    def update_spaces_left(self, last_row, last_col):
-        """
-        Update the number of moveable spaces left
-        """
-        if not self.player_piece.within_a_room(self.board.rooms):
-            if self.player_piece.row != last_row or self.player_piece.column != last_col:
-                self.player_spaces_remaining -= 1
-                self.spaces_remaining -= 1
-
-    def on_update(self, delta_time):
-        """
-        Update animations and handle AI rolls.
-        """
-        from GameOverView import GameOverView
-
-        self.die.update_animation()
-
-        # Automatically handle AI players' rolls if it's not the user's turn     
-        if self.popup_enabled:
-            pass
-        elif not self.whose_turn[0]:
-            self.roll_die_for_current_player()
-
-            # Once the AI rolled have them suggest/accuse if they are in a room
-            current_player_index = self.whose_turn.index(True)
-
-            # Have AI's make a suggestion, or accuse if they're ready (and able) to
-            if current_player_index == 1:
-                current_room = self.ai_1.get_room(self.board.rooms)
-                # only allow accusation while in middle room
-                if self.ai_1.ready_to_accuse and current_room == "Lobby":
-                    print(f"{self.ai_card_1_name} makes an accusation!")
-                    print(self.ai_1_accuse_cards)
-
-                    # End the game if an AI makes an accusation (they will always be right)
-                    game_over_view = GameOverView(False)
-                    self.window.show_view(game_over_view)
-
-                # make a suggestion if AI is in a room
-                elif self.ai_1.within_a_room(self.board.rooms):
-                    # Make a suggestion, show the user the suggestion, and then refute it
-                    ai_guessed_cards = self.ai_1.make_ai_suggestion(1)
-
-                    self.popup_text.text = f"{self.ai_card_1_name} Suggests: {ai_guessed_cards[0]} in the {ai_guessed_cards[1]} with the {ai_guessed_cards[2]}\n(Click to continue)"
-                    self.popup_enabled = True
-
-                    refuted, refute_card = self.deck.refute_guess(ai_guessed_cards, self.all_decks, self.all_decks[1])
-
-                    # Update AI's note sheet if someone refuted their suggestion, otherwise tell
-                    # them to go and make an accusation
-                    if refuted:
-                        self.notesheet_view.update_refute_card(refute_card, 1)
-                    else:
-                        # tell the AI to go to the middle room to make an accusation
-                        self.ai_1.goal(16, 11, "Lobby")
-                        self.notesheet_view.update_accusation(ai_guessed_cards, 1)
-                        self.ai_1_accuse_cards = ai_guessed_cards
-                        self.ai_1.ready_to_accuse = True
-                self.ai_turn_completed = True
-
-            elif current_player_index == 2:
-                current_room = self.ai_2.get_room(self.board.rooms)
-                if self.ai_2.ready_to_accuse and current_room == "Lobby":
-                    print(f"{self.ai_card_2_name} makes an accusation!")
-                    print(self.ai_2_accuse_cards)
-
-                    game_over_view = GameOverView(False)
-                    self.window.show_view(game_over_view)
-
-                elif self.ai_2.within_a_room(self.board.rooms):
-                    ai_guessed_cards = self.ai_2.make_ai_suggestion(2)
-                    self.popup_text.text = f"{self.ai_card_2_name} Suggests: {ai_guessed_cards[0]} in the {ai_guessed_cards[1]} with the {ai_guessed_cards[2]}\n(Click to continue)"
-                    self.popup_enabled = True
-                    refuted, refute_card = self.deck.refute_guess(ai_guessed_cards, self.all_decks, self.all_decks[2])
-
-                    if refuted:
-                        self.notesheet_view.update_refute_card(refute_card, 2)
-                    else:
-                        self.ai_2.goal(16, 11, "Lobby")
-                        self.notesheet_view.update_accusation(ai_guessed_cards, 2)
-                        self.ai_2_accuse_cards = ai_guessed_cards
-                        self.ai_2.ready_to_accuse = True
-                        
-                self.ai_turn_completed = True
-
-            elif current_player_index == 3:
-                current_room = self.ai_3.get_room(self.board.rooms)
-                if self.ai_3.ready_to_accuse and current_room == "Lobby":
-                    print(f"{self.ai_card_3_name} makes an accusation!")
-                    print(self.ai_3_accuse_cards)
-
-                    game_over_view = GameOverView(False)
-                    self.window.show_view(game_over_view)
-                elif self.ai_3.within_a_room(self.board.rooms):
-                    ai_guessed_cards = self.ai_3.make_ai_suggestion(3)
-                    self.popup_text.text = f"{self.ai_card_3_name} Suggests: {ai_guessed_cards[0]} in the {ai_guessed_cards[1]} with the {ai_guessed_cards[2]}\n(Click to continue)"
-                    self.popup_enabled = True
-                    refuted, refute_card = self.deck.refute_guess(ai_guessed_cards, self.all_decks, self.all_decks[3])
-
-                    if refuted:
-                        self.notesheet_view.update_refute_card(refute_card, 3)
-                    else:
-                        self.ai_3.goal(16, 11, "Lobby")
-                        self.notesheet_view.update_accusation(ai_guessed_cards, 3)
-                        self.ai_3_accuse_cards = ai_guessed_cards
-                        self.ai_3.ready_to_accuse = True
-                self.ai_turn_completed = True
-            else:
-                print("invalid ai index, cannot play their turn")
-
-            # If the AI has rolled, proceed to the next turn
-            if self.ai_turn_completed:
-                self.next_turn()
-
-    def on_close(self):
-        """
-        Handle window close
-        Reset the notesheet on window close
-        """
-        save_file = "notesheet_state.json"
-        ai_save_file = "ai_notesheet_state.json"
-
-        # Disable the UI manager and delete the save file
-        self.ui_manager.disable()
-
-        # Delete the notesheet save file (for player and ai) to reset the state
-        if os.path.exists(save_file):
-            os.remove(save_file)
-        if os.path.exists(ai_save_file):
-            os.remove(ai_save_file)
 
 def main():
     """ Main function """
-    from InstructionView import InstructionView
+    parser = argparse.ArgumentParser(description="Play Clue against three computer players")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long the imports and the first frame take, then exit")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of every game's deal, dice and AI choices, to play the same game again")
+    parser.add_argument("--resume", metavar="FILE", default=None,
+                        help="pick up a saved game, the game saves itself to savegame.bin every turn")
+    parser.add_argument("--log-level", choices=["debug", "info", "warning", "off"], default="info",
+                        help="lowest level of game events to log (debug traces every move)")
+    parser.add_argument("--log-file", default=None,
+                        help="write game events to this file as JSON lines instead of the console")
+    args = parser.parse_args()
+
+    # Importing any engine module loads the whole engine package, which every
+    # view needs anyway, so it's timed as the first step of starting up
+    profile = StartupProfile()
+    with profile.step("import engine"):
+        from engine.rng import MIN_SEED, MAX_SEED
+        from engine.eventlog import event_log, FileSink, LEVELS
+
+    # A seed has to fit in the game's snapshots, which are saved every turn
+    if args.seed is not None and not MIN_SEED <= args.seed <= MAX_SEED:
+        parser.error(f"--seed must be between {MIN_SEED} and {MAX_SEED}")
+
+    event_log.set_level(LEVELS[args.log_level])
+    if args.log_file is not None:
+        event_log.set_sink(FileSink(args.log_file))
+
+        # Write out the events still buffered however the game exits
+        atexit.register(event_log.close)
+
+    # Only what the instruction screen needs is imported here, every other
+    # view imports its modules when it's first shown
+    with profile.step("import arcade"):
+        import arcade
+    with profile.step("import InstructionView"):
+        from InstructionView import InstructionView
+    with profile.step("create window"):
+        window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, visible=not args.profile_startup)
+        window.seed = args.seed
+        window.resume_file = args.resume
+    with profile.step("show first view"):
+        if args.resume is None:
+            start_view = InstructionView()
+        else:
+            # Go straight back into the saved game
+            from GameView import GameView
+            start_view = GameView()
+        window.show_view(start_view)
+
+    if args.profile_startup:
+        with profile.step("first frame"):
+            start_view.on_draw()
+            window.flip()
+        profile.report()
+        window.close()
+        return
 
-    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
-    start_view = InstructionView()
-    window.show_view(start_view)
     arcade.run()
 
 
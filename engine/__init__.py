@@ -0,0 +1,13 @@
+# Pure-Python game rules for Clue. Nothing in this package imports arcade, so
+# whole games can be played without a window; the arcade views render on top.
+from engine.board import Board, BoardTopology, Door, Room, get_topology, NO_ROOM, UNREACHABLE, ROW_COUNT, COLUMN_COUNT
+from engine.cards import Card, Deck, SUSPECT_CARD_VALUES, WEAPON_CARD_VALUES, ROOM_CARD_VALUES
+from engine.dice import Die
+from engine.deduction import Deduction, CARD_VALUES, CARD_IDS, SUSPECT_MASK, WEAPON_MASK, ROOM_MASK
+from engine.notes import Notes, NotesheetBox, SUSPECTS, WEAPONS, ROOMS, SECTIONS, CARD_COUNT
+from engine.pieces import Piece, HumanPiece, ComputerPiece
+from engine.planner import PathPlanner, plan_paths
+from engine.rng import GameRandom, DIE_ANIMATION, MIN_SEED, MAX_SEED
+from engine.eventlog import EventLog, ConsoleSink, FileSink, event_log, DEBUG, INFO, WARNING, OFF, LEVELS
+from engine.game import Game, STARTING_POSITIONS, SUGGEST, ACCUSE
+from engine.snapshot import snapshot_game, restore_game, save_game, resume_game
@@ -0,0 +1,637 @@
+# Board layout and movement rules: rooms, doors, piece locations and A* pathfinding
+import functools
+import heapq
+import random
+from array import array
+
+# Set number of rows and columns for the board grid
+ROW_COUNT = 24
+COLUMN_COUNT = 24
+
+# The room grid is padded by one square on every side so the "Outside"
+# boundaries that sit just off the board (row/column -1 and 24) can be looked up
+GRID_PADDING = 1
+GRID_ROWS = ROW_COUNT + 2 * GRID_PADDING
+GRID_COLUMNS = COLUMN_COUNT + 2 * GRID_PADDING
+
+# Room id stored in the room grid for squares that aren't inside any room
+NO_ROOM = -1
+
+# Nodes of the movement graph: one per square of the board, then one per room
+SQUARE_COUNT = ROW_COUNT * COLUMN_COUNT
+
+# Distance stored in a distance map for nodes that can't be reached
+UNREACHABLE = -1
+
+
+class Room:
+    def __init__(self, name, boundaries, accessible):
+        """
+        Create a room with a given name and boundaries.
+        Boundaries should be a list of tuples [(row_start, row_end, col_start, col_end)].
+        """
+        self.name = name
+        self.boundaries = boundaries
+        self.accessible = accessible    
+
+
+class Door:
+    def __init__(self, boundaries, entry_direction, room_name):
+        """
+        Create a door with a row, col, direction of entry, and associated room
+        Boundaries are in format (row, col)
+        """
+        self.boundaries = boundaries
+        self.entry_direction = entry_direction
+        self.room_name = room_name
+
+    def get_room_entry_position(self):
+        """
+        Calculate the position inside the room based on the entry direction.
+        """
+        row, col = self.boundaries
+        if self.entry_direction == "UP":
+            return row + 1, col
+        elif self.entry_direction == "DOWN":
+            return row - 1, col
+        elif self.entry_direction == "LEFT":
+            return row, col - 1
+        elif self.entry_direction == "RIGHT":
+            return row, col + 1
+
+class BoardTopology:
+    def __init__(self):
+        """
+        Set up the rooms and doors of the board. None of this changes during
+        a game, so a single instance is shared by every board (see get_topology)
+        """
+        # Create the rooms with boundaries
+        self.rooms = (
+            Room("Conservatory", [(0, 3, 0, 5), (4,4,1,4)], True),
+            Room("Billiard Room", [(7, 11, 0, 5)], True),
+            Room("Library", [(14, 16, 0, 0), (14, 16, 6, 6), (13, 17, 1, 5)], True),
+            Room("Study", [(20, 22, 0, 6), (23, 23, 0, 5)], True),
+            Room("Hall", [(17, 22, 9, 14), (23, 23, 10, 13)], True),
+            Room("Lounge", [(18, 23, 17, 23)], True),
+            Room("Dining Room", [(9, 14, 16, 23), (8, 8, 19, 23)], True),
+            Room("Kitchen", [(0, 4, 18, 23), (5, 5, 18, 22)], True),
+            Room("Ball Room", [(1, 6, 8, 15), (0, 0, 10, 13)], True),
+            Room("Lobby", [(9, 15, 9, 13)], False),
+            Room("Outside", [(0, 0, 6, 6), (6, 6, 0, 0), (5, 5, -1, -1), (4, 4, 0, 0), (12, 12, 0, 0), (13, 13, 0, 0),
+                             (17, 17, 0, 0), (19, 19, 0, 0), (23, 23, 6, 6), (23, 23, 8, 8), (23, 23, 9, 9),
+                             (23, 23, 14, 14), (23, 23, 15, 15), (23, 23, 17, 17), (17, 17, 23, 23), (15, 15, 23, 23),
+                             (7, 7, 23, 23), (5, 5, 23, 23), (0, 0, 17, 17), (16, 16, 24, 24), (18, 18, -1, -1),
+                             (24, 24, 7, 7), (24, 24, 16, 16), (6, 6, 24, 24), (-1, -1, 7, 16)], 
+                             False)
+        )
+
+        # Define doors for the rooms
+        self.doors = (
+            Door((4, 5), "LEFT", "Conservatory"), 
+            Door((12, 1), "DOWN", "Billiard Room"), 
+            Door((8, 6), "LEFT", "Billiard Room"), 
+            Door((12, 3), "UP", "Library"),
+            Door((15,7), "LEFT", "Library"), 
+            Door((19,6), "UP", "Study"), 
+            Door((19,8), "RIGHT", "Hall"), 
+            Door((16,11), "UP", "Hall"), 
+            Door((16,12), "UP", "Hall"), 
+            Door((17,17), "UP", "Lounge"), 
+            Door((15,17), "DOWN", "Dining Room"), 
+            Door((11,15), "RIGHT", "Dining Room"), 
+            Door((6,19), "DOWN", "Kitchen"), 
+            Door((4,16), "LEFT", "Ball Room"), 
+            Door((7,14), "DOWN", "Ball Room"), 
+            Door((7,9), "DOWN", "Ball Room"), 
+            Door((4,7), "RIGHT", "Ball Room"), 
+            Door((16,11), "DOWN", "Lobby")
+        )
+
+        # Compile the room boundaries into a lookup table
+        self.compile_rooms()
+
+        # Index the doors by the square and direction they're entered from, and by room
+        self.compile_doors()
+
+        # Compile the squares, rooms and doors into a movement graph with the
+        # distances from every door and room
+        self.compile_moves()
+
+    def compile_rooms(self):
+        """
+        Build a dense grid holding the index into self.rooms of the room that
+        covers each square, so room lookups don't have to scan every boundary.
+        """
+        self.room_names = tuple(room.name for room in self.rooms)
+        room_grid = array("b", [NO_ROOM]) * (GRID_ROWS * GRID_COLUMNS)
+
+        # Fill in reverse so the first room listed wins where boundaries overlap,
+        # matching the order rooms used to be scanned in
+        for room_id in range(len(self.rooms) - 1, -1, -1):
+            for row_start, row_end, col_start, col_end in self.rooms[room_id].boundaries:
+                for row in range(row_start, row_end + 1):
+                    offset = (row + GRID_PADDING) * GRID_COLUMNS + GRID_PADDING
+                    for col in range(col_start, col_end + 1):
+                        room_grid[offset + col] = room_id
+
+        # Hand out a read-only view so no board can change the shared grid
+        self.room_grid = memoryview(room_grid).toreadonly()
+
+    def get_room_id(self, position):
+        """
+        Return the index into rooms of the room containing the given
+        position (row, col), or NO_ROOM if it isn't inside a room.
+        """
+        row = position[0] + GRID_PADDING
+        col = position[1] + GRID_PADDING
+        if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLUMNS:
+            return self.room_grid[row * GRID_COLUMNS + col]
+        return NO_ROOM
+
+    def get_room(self, position):
+        """
+        Check if the given position (row, col) is inside any room.
+        Returns the room name if inside a room, otherwise None.
+        """
+        room_id = self.get_room_id(position)
+        if room_id == NO_ROOM:
+            return None  # Not inside any room
+        return self.room_names[room_id]  # Position is inside this room
+
+    def compile_doors(self):
+        """
+        Build the door lookups: doors_by_entry maps (row, col, entry_direction)
+        to the door entered by moving in that direction from that square, and
+        doors_by_room maps a room name to the tuple of its doors
+        """
+        self.doors_by_entry = {}
+        doors_by_room = {}
+        for door in self.doors:
+            row, col = door.boundaries
+            self.doors_by_entry[(row, col, door.entry_direction)] = door
+            doors_by_room.setdefault(door.room_name, []).append(door)
+        self.doors_by_room = {room_name: tuple(doors) for room_name, doors in doors_by_room.items()}
+
+    def get_doors(self, room_name):
+        """
+        Return the doors of a room, an empty tuple for rooms without any
+        """
+        return self.doors_by_room.get(room_name, ())
+
+    def compile_moves(self):
+        """
+        Build the movement graph of the board: hallway squares connect to the
+        hallway squares next to them, and a door square connects to its room
+        (a whole room is a single node). Then run a breadth-first search from
+        every door and room, the board never changes so this is done once.
+        """
+        self.node_count = SQUARE_COUNT + len(self.rooms)
+        neighbors = [[] for _ in range(self.node_count)]
+        for row in range(ROW_COUNT):
+            for col in range(COLUMN_COUNT):
+                if self.get_room_id((row, col)) != NO_ROOM:
+                    continue
+                for next_row, next_col in ((row + 1, col), (row - 1, col), (row, col - 1), (row, col + 1)):
+                    if (0 <= next_row < ROW_COUNT and 0 <= next_col < COLUMN_COUNT
+                            and self.get_room_id((next_row, next_col)) == NO_ROOM):
+                        neighbors[row * COLUMN_COUNT + col].append(next_row * COLUMN_COUNT + next_col)
+        for door in self.doors:
+            door_node = self.get_node(door.boundaries)
+            room_node = SQUARE_COUNT + self.room_names.index(door.room_name)
+            neighbors[door_node].append(room_node)
+            neighbors[room_node].append(door_node)
+        self.neighbors = tuple(tuple(node_neighbors) for node_neighbors in neighbors)
+
+        # The same graph without the rooms, for planning paths along the hallways
+        self.hallway_neighbors = tuple(tuple(node for node in node_neighbors if node < SQUARE_COUNT)
+                                       for node_neighbors in neighbors)
+
+        self.distance_maps = {}
+        self.shortest_maps = {}
+        for door in self.doors:
+            self.get_distance_map(door.boundaries)
+        for room_id in range(len(self.rooms)):
+            if neighbors[SQUARE_COUNT + room_id]:
+                self.distance_maps[SQUARE_COUNT + room_id] = self.search(SQUARE_COUNT + room_id)
+
+        # Answers to reachable, keyed by (node, roll), and A* estimates keyed by goals
+        self.reachable_cache = {}
+        self.estimate_maps = {}
+
+    def get_node(self, position):
+        """
+        Return the movement graph node of a position: its square in the
+        hallway, or the whole room when it's inside one
+        """
+        room_id = self.get_room_id(position)
+        if room_id != NO_ROOM:
+            return SQUARE_COUNT + room_id
+        return position[0] * COLUMN_COUNT + position[1]
+
+    def search(self, start):
+        """
+        Breadth-first search from the start node. Returns a distance map that
+        holds, at index node * 2 + parity, the fewest steps with that parity
+        (even or odd) to reach the node, or UNREACHABLE.
+        Entering a room ends a move, so only the start room is searched out of.
+        """
+        distances = array("h", [UNREACHABLE]) * (self.node_count * 2)
+        distances[start * 2] = 0
+        frontier = [start]
+        steps = 0
+        while frontier:
+            steps += 1
+            parity = steps % 2
+            next_frontier = []
+            for node in frontier:
+                if node >= SQUARE_COUNT and node != start:
+                    continue
+                for neighbor in self.neighbors[node]:
+                    if neighbor != start and distances[neighbor * 2 + parity] == UNREACHABLE:
+                        distances[neighbor * 2 + parity] = steps
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+
+    def get_distance_map(self, position):
+        """
+        Return the distance map (see search) from a position. Maps from doors
+        and rooms are built up front, any other square's on first use.
+        """
+        start = self.get_node(position)
+        distances = self.distance_maps.get(start)
+        if distances is None:
+            distances = self.distance_maps[start] = self.search(start)
+        return distances
+
+    def get_shortest_map(self, position):
+        """
+        Return the fewest steps of either parity from position to every node,
+        indexed by node, built from its distance map on first use
+        """
+        start = self.get_node(position)
+        shortest = self.shortest_maps.get(start)
+        if shortest is None:
+            distances = self.get_distance_map(position)
+            shortest = array("h", [UNREACHABLE]) * self.node_count
+            for node in range(self.node_count):
+                even, odd = distances[node * 2], distances[node * 2 + 1]
+                if even == UNREACHABLE or odd == UNREACHABLE:
+                    shortest[node] = max(even, odd)
+                else:
+                    shortest[node] = min(even, odd)
+            self.shortest_maps[start] = shortest
+        return shortest
+
+    def distance(self, start, goal):
+        """
+        Return the fewest steps from the start position to the goal position
+        (or the goal's room), ignoring other pieces, or UNREACHABLE
+        """
+        return self.get_shortest_map(start)[self.get_node(goal)]
+
+    def nearest_distance(self, position, goals):
+        """
+        Return the fewest steps from position to the nearest of the goal
+        positions, ignoring other pieces, or UNREACHABLE.
+        Other pieces only ever make a path longer, so this never overestimates.
+        """
+        node = self.get_node(position)
+        nearest = UNREACHABLE
+        for goal in goals:
+            steps = self.get_shortest_map(goal)[node]
+            if steps != UNREACHABLE and (nearest == UNREACHABLE or steps < nearest):
+                nearest = steps
+        return nearest
+
+    def get_estimate_map(self, goals):
+        """
+        Return, for every square of the board, the fewest steps to the nearest
+        of the goal positions ignoring other pieces, or UNREACHABLE.
+        The distance maps treat a whole room as one square, so inside a room
+        this adds the steps across the room to the square inside each door.
+        Built on first use for each set of goals.
+        """
+        goals = frozenset(goals)
+        estimates = self.estimate_maps.get(goals)
+        if estimates is None:
+            # how far it is to the goals from just outside every door
+            steps_out = {}
+            for door in self.doors:
+                steps = self.nearest_distance(door.boundaries, goals)
+                if steps != UNREACHABLE:
+                    steps_out[door] = steps
+
+            estimates = array("h", [UNREACHABLE]) * SQUARE_COUNT
+            for row in range(ROW_COUNT):
+                for col in range(COLUMN_COUNT):
+                    estimate = self.nearest_distance((row, col), goals)
+                    room_name = self.get_room((row, col))
+                    if room_name is not None and estimate > 0:
+                        # the way out of the room is through the square inside one of its doors
+                        ways_out = []
+                        for door in self.get_doors(room_name):
+                            if door in steps_out:
+                                entry_row, entry_col = door.get_room_entry_position()
+                                ways_out.append(abs(row - entry_row) + abs(col - entry_col) + 1 + steps_out[door])
+                        if ways_out:
+                            estimate = min(ways_out)
+                    estimates[row * COLUMN_COUNT + col] = estimate
+            self.estimate_maps[goals] = estimates
+        return estimates
+
+    def reachable(self, position, roll):
+        """
+        Return the hallway squares a piece at position can end its move on
+        with exactly roll steps, and the names of the rooms it can enter with
+        at most roll steps (entering a room ends the move). Other pieces are
+        ignored, and a piece may step back over squares it has crossed.
+        """
+        start = self.get_node(position)
+        key = (start, roll)
+        if key not in self.reachable_cache:
+            distances = self.get_distance_map(position)
+            parity = roll % 2
+            squares = []
+            for node in range(SQUARE_COUNT):
+                steps = distances[node * 2 + parity]
+                if steps != UNREACHABLE and steps <= roll:
+                    squares.append(divmod(node, COLUMN_COUNT))
+            rooms = []
+            for room_id, name in enumerate(self.room_names):
+                node = SQUARE_COUNT + room_id
+                steps = [distance for distance in distances[node * 2:node * 2 + 2] if distance != UNREACHABLE]
+                if node != start and steps and min(steps) <= roll:
+                    rooms.append(name)
+            self.reachable_cache[key] = (tuple(squares), tuple(rooms))
+        return self.reachable_cache[key]
+
+
+def goal_positions(goal):
+    """
+    Return a goal given as one position (row, col) or any collection of
+    positions as a frozenset of positions
+    """
+    if isinstance(goal, tuple) and len(goal) == 2 and isinstance(goal[0], int):
+        return frozenset([goal])
+    return frozenset(goal)
+
+
+@functools.lru_cache(maxsize=None)
+def get_topology():
+    """
+    Return the BoardTopology shared by every board in the process
+    """
+    return BoardTopology()
+
+
+class Board:
+    def __init__(self, topology=None):
+        """
+        Set up the piece locations of a single game on top of the shared
+        rooms and doors
+        """
+        self.topology = topology or get_topology()
+        self.rooms = self.topology.rooms
+        self.doors = self.topology.doors
+        self.doors_by_entry = self.topology.doors_by_entry
+
+        self.player_locations =  {
+            "Miss Scarlet": [23, 16],
+            "Colonel Mustard": [16, 23],
+            "Mrs. White": [23, 7],
+            "Mr. Green": [6, 23],
+            "Mrs. Peacock": [5, 0],
+            "Professor Plum": [18, 0]
+        }
+
+        # Number of pieces on every square, laid out like the room grid and kept
+        # in step with player_locations by move_piece
+        self.occupancy = bytearray(GRID_ROWS * GRID_COLUMNS)
+        for row, col in self.player_locations.values():
+            self.occupancy[(row + GRID_PADDING) * GRID_COLUMNS + col + GRID_PADDING] += 1
+
+    def get_room_id(self, position):
+        """
+        Return the index into self.rooms of the room containing the given
+        position (row, col), or NO_ROOM if it isn't inside a room.
+        """
+        return self.topology.get_room_id(position)
+
+    def get_room(self, position):
+        """
+        Check if the given position (row, col) is inside any room.
+        Returns the room name if inside a room, otherwise None.
+        """
+        return self.topology.get_room(position)
+
+    def get_doors(self, room_name):
+        """
+        Return the doors of a room, an empty tuple for rooms without any
+        """
+        return self.topology.get_doors(room_name)
+
+    def move_piece(self, character_name, position):
+        """
+        Record that the character's piece has moved to position (row, col)
+        """
+        row, col = self.player_locations[character_name]
+        self.occupancy[(row + GRID_PADDING) * GRID_COLUMNS + col + GRID_PADDING] -= 1
+        row, col = position
+        self.occupancy[(row + GRID_PADDING) * GRID_COLUMNS + col + GRID_PADDING] += 1
+        self.player_locations[character_name] = [row, col]
+
+    def is_occupied(self, position):
+        """
+        Check if any piece is on the given position (row, col)
+        """
+        row = position[0] + GRID_PADDING
+        col = position[1] + GRID_PADDING
+        if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLUMNS:
+            return self.occupancy[row * GRID_COLUMNS + col] != 0
+        return False
+
+    def distance(self, start, goal):
+        """
+        Return the fewest steps between two positions, ignoring other pieces
+        """
+        return self.topology.distance(start, goal)
+
+    def reachable(self, position, roll):
+        """
+        Return the squares and rooms a piece at position can move to with the
+        given roll (see BoardTopology.reachable)
+        """
+        return self.topology.reachable(position, roll)
+
+
+    def can_move(self, current, direction, start, goal):
+        """
+        Check if the player can move from the current position in the specified direction.
+        goal is a position or a collection of positions (see a_star).
+        """
+        row, col = current
+        next_position = {
+            "UP": (row + 1, col),
+            "DOWN": (row - 1, col),
+            "LEFT": (row, col - 1),
+            "RIGHT": (row, col + 1),
+        }.get(direction)
+
+        opposites = {"UP": "DOWN", 
+                     "DOWN": "UP", 
+                     "LEFT": "RIGHT", 
+                     "RIGHT": "LEFT"}
+        
+        # Get names of all coordinate rooms
+        current_room = self.get_room(current)
+        next_room = self.get_room(next_position)
+        start_room = self.get_room(start)
+        goal_rooms = {self.get_room(position) for position in goal_positions(goal)}
+
+        # Ensure next_position is within the board bounds
+        if not (0 <= next_position[0] < ROW_COUNT and 0 <= next_position[1] < COLUMN_COUNT):
+            return False  # Out of bounds
+        
+        # Check for user collision
+        if self.is_occupied(next_position):
+            return False
+
+        # Check if the move is through a door into a room
+        if (row, col, direction) in self.doors_by_entry and next_room in goal_rooms:
+            return True  # Move through a door
+
+        # Check if move is through a door, out of a room
+        if (next_position[0], next_position[1], opposites[direction]) in self.doors_by_entry:
+            return True  # Move through a door
+        
+        # Allow movement within a room if it is within a start, goal, or not a room 
+        if current_room == next_room and (next_room == start_room or next_room in goal_rooms or next_room == None):
+            return True
+
+        return False  # Move is not valid
+
+    
+    def heuristic(self, current, goals):
+        """
+        Estimate the steps from current to the nearest of goals from the
+        distances around the walls (see BoardTopology.get_estimate_map) and
+        the Manhattan distance, neither of which overestimates
+        """
+        row, col = current
+        estimate = self.topology.get_estimate_map(goals)[row * COLUMN_COUNT + col]
+        if estimate == UNREACHABLE:
+            return UNREACHABLE
+        manhattan = min(abs(row - goal[0]) + abs(col - goal[1]) for goal in goals)
+        return max(estimate, manhattan)
+
+    def get_neighbors(self, position, start, goal):
+        """Return accessible neighbors of the given position based on walls."""
+        row, col = position
+        neighbors = []
+
+        directions = {
+            "UP": (row + 1, col),
+            "DOWN": (row - 1, col),
+            "LEFT": (row, col - 1),
+            "RIGHT": (row, col + 1),
+        }
+
+        for direction, (r, c) in directions.items():
+            # Ensure within bounds and no rooms block movement
+            if 0 <= r < ROW_COUNT and 0 <= c < COLUMN_COUNT and self.can_move(position, direction, start, goal):
+                neighbors.append((r, c))
+
+        return neighbors
+
+    def a_star(self, start, goal):
+        """
+        Find the shortest path from start to goal using A*.
+        goal is a position (row, col) or a collection of positions, such as
+        every door of a room, and the path leads to the nearest of them.
+        The number of nodes expanded is left in self.expansions.
+        """
+        goals = goal_positions(goal)
+        self.expansions = 0
+
+        # (f_cost, estimate, position), ties between equal f_costs go to the square
+        # closest to a goal so only one of many equally short paths is followed
+        open_list = []
+        heapq.heappush(open_list, (0, 0, start))
+
+        came_from = {}  # To reconstruct path
+        g_score = {start: 0}
+        f_score = {start: self.heuristic(start, goals)}
+
+        while open_list:
+            f_cost, _, current = heapq.heappop(open_list)
+            if f_cost > f_score[current]:
+                continue  # a better route to this square was queued after this one
+            self.expansions += 1
+
+            if current in goals:
+                return self.reconstruct_path(came_from, current)
+
+            for neighbor in self.get_neighbors(current, start, goals):
+                tentative_g_score = g_score[current] + 1  # Cost to move to neighbor (one tile)
+
+                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                    estimate = self.heuristic(neighbor, goals)
+                    if estimate == UNREACHABLE:
+                        continue  # walled off from every goal
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    f_score[neighbor] = tentative_g_score + estimate
+                    heapq.heappush(open_list, (f_score[neighbor], estimate, neighbor))
+
+        return None  # No path found
+
+    def reconstruct_path(self, came_from, current):
+        """Reconstruct the path from start to goal."""
+        path = [current]
+        while current in came_from:
+            current = came_from[current]
+            path.append(current)
+        path.reverse()
+        return path
+    
+    def get_goal_in_reach(self, position, roll, room_names, rng=random):
+        """
+        Select a random room (drawn from rng) out of room_names that can be
+        entered from position with the given roll and return its closest door
+        as a goal (row, col, room_name), or None if none of them are in reach
+        """
+        _, rooms_in_reach = self.reachable(position, roll)
+        goal_rooms = [name for name in rooms_in_reach if name in room_names]
+        if not goal_rooms:
+            return None
+        goal_room = rng.choice(goal_rooms)
+
+        room_doors = [door.boundaries for door in self.get_doors(goal_room)
+                      if self.distance(position, door.boundaries) != UNREACHABLE]
+        goal_row, goal_col = min(room_doors, key=lambda boundaries: self.distance(position, boundaries))
+        return goal_row, goal_col, goal_room
+
+    def get_random_goal(self, room_names=None, rng=random):
+        """
+        Select a random accessible room as a goal and return an entry point,
+        drawing from rng. If room_names is given, only pick from those rooms
+        (when any of them can be entered).
+        """
+        # filter rooms that are accessible
+        accessible_rooms = [room for room in self.rooms if room.accessible and room.name != "Lobby"]
+        if room_names is not None:
+            wanted_rooms = [room for room in accessible_rooms if room.name in room_names]
+            if wanted_rooms:
+                accessible_rooms = wanted_rooms
+            
+        # select a random accessible room
+        selected_room = rng.choice(accessible_rooms)
+
+        # find doors associated with the selected room
+        room_doors = self.get_doors(selected_room.name)
+
+        # select a random door for the room
+        selected_door = rng.choice(room_doors)
+
+        return selected_door.boundaries[0], selected_door.boundaries[1], selected_room.name
\ No newline at end of file
@@ -0,0 +1,121 @@
+# Define functions to maintain a deck of cards
+import random
+
+from engine.eventlog import event_log
+
+TOTAL_CARDS = 21
+TOTAL_GAME_CARDS = 18  # removed the 3 murderer cards
+
+SUSPECT_CARD_VALUES = ["Miss Scarlet", "Colonel Mustard", "Mrs. White", "Mr. Green", "Mrs. Peacock", "Professor Plum"]
+WEAPON_CARD_VALUES = ["Candlestick", "Wrench", "Rope", "Lead Pipe", "Knife", "Revolver"]
+ROOM_CARD_VALUES = ["Conservatory", "Dining Room", "Library", "Billiard Room", "Lounge", "Kitchen", "Ball Room",
+                    "Study", "Hall"]
+
+
+# A Card Class that keeps track of what type of card it is
+# (suspect, weapon, or room) and what value that card holds
+class Card:
+    def __init__(self, card_type, value):
+        self.card_type = card_type
+        self.value = value
+
+
+# A Deck Class that creates the decks for the AIs and the Player
+class Deck:
+    def __init__(self):
+
+        self.held_cards = []
+        self.all_cards = []
+        self.all_decks = []
+        self.killer_cards = []
+
+    # Create a single card, renderers override this to build sprites instead
+    def make_card(self, card_type, value):
+        return Card(card_type, value)
+
+    # Function to set up/deal cards, shuffling with rng
+    def deal(self, num_players, rng=random):
+        # Create all the cards in the game
+        for i in range(6):
+            suspect_card = self.make_card("Suspects", SUSPECT_CARD_VALUES[i])
+            self.all_cards.append(suspect_card)
+            weapon_card = self.make_card("Weapons", WEAPON_CARD_VALUES[i])
+            self.all_cards.append(weapon_card)
+        for i in range(9):
+            room_card = self.make_card("Rooms", ROOM_CARD_VALUES[i])
+            self.all_cards.append(room_card)
+
+        # Shuffle the cards
+        rng.shuffle(self.all_cards)
+
+        # Choose 3 cards (one of each type) for the killer
+        self.choose_killer(self.all_cards, self.killer_cards)
+
+        # Put cards into piles based on the number of players
+        deck_size = int(TOTAL_GAME_CARDS / num_players)  # Game cards excludes the three killer cards
+        extra_cards = TOTAL_GAME_CARDS - (deck_size * num_players)
+        temp_deck = []
+
+        for player in range(num_players):
+            for index in range(deck_size):
+                temp_deck.append(self.all_cards.pop())
+
+            # Add any extra cards to the deck
+            if extra_cards != 0:
+                temp_deck.append(self.all_cards.pop())
+                extra_cards -= 1
+
+            self.all_decks.append(temp_deck)
+            temp_deck = []
+
+        # Shuffle decks so the first players don't always get the extra cards
+        rng.shuffle(self.all_decks)
+
+    # Function to add 3 cards (one of each type) to the envelope in the middle of the board
+    def choose_killer(self, all_cards, killer_cards):
+        suspect = False
+        weapon = False
+        room = False
+        for card in all_cards:
+            if card.card_type == "Suspects" and not suspect:
+                killer_cards.append(card)
+                all_cards.remove(card)
+                suspect = True
+            elif card.card_type == "Weapons" and not weapon:
+                killer_cards.append(card)
+                all_cards.remove(card)
+                weapon = True
+            elif card.card_type == "Rooms" and not room:
+                killer_cards.append(card)
+                all_cards.remove(card)
+                room = True
+
+    def get_all_cards(self):
+        return self.all_decks
+
+    # A function that takes guess cards and sees if any other players can refute the guess
+    # Returns True and the card if found, and false and NULL/None if not
+    def refute_guess(self, guessed_cards, decks, guessers_deck):
+        refuter, card = self.find_refuter(guessed_cards, decks)
+        if refuter is not None:
+            return True, card
+
+        # The card wasn't found
+        event_log.info(None, "unrefuted", cards=guessed_cards)
+        return False, None
+
+    def find_refuter(self, guessed_cards, decks):
+        """
+        Return the seat of the first deck holding one of the guessed cards
+        and the card it shows, or (None, None) if nobody can refute
+        """
+        # Loop through all cards in each deck
+        for seat, deck in enumerate(decks):
+            for card in deck:
+                # If card is in ANY deck (including the AI's), then return it
+                if card.value in guessed_cards:
+                    return seat, card
+        return None, None
+
+    def get_killer(self):
+        return self.killer_cards
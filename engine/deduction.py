@@ -0,0 +1,174 @@
+# Card deduction for the AI. What every player (and the envelope) has or
+# doesn't have is packed into 21-bit masks, one bit per card
+import random
+
+from engine.cards import SUSPECT_CARD_VALUES, WEAPON_CARD_VALUES, ROOM_CARD_VALUES
+
+# Every card in deck order, the index of a card is its bit in the masks
+CARD_VALUES = SUSPECT_CARD_VALUES + WEAPON_CARD_VALUES + ROOM_CARD_VALUES
+CARD_IDS = {value: card_id for card_id, value in enumerate(CARD_VALUES)}
+CARD_TYPES = (["Suspects"] * len(SUSPECT_CARD_VALUES) + ["Weapons"] * len(WEAPON_CARD_VALUES)
+              + ["Rooms"] * len(ROOM_CARD_VALUES))
+
+ALL_CARDS = (1 << len(CARD_VALUES)) - 1
+SUSPECT_MASK = (1 << len(SUSPECT_CARD_VALUES)) - 1
+WEAPON_MASK = ((1 << len(WEAPON_CARD_VALUES)) - 1) << len(SUSPECT_CARD_VALUES)
+ROOM_MASK = ALL_CARDS ^ SUSPECT_MASK ^ WEAPON_MASK
+CATEGORY_MASKS = (SUSPECT_MASK, WEAPON_MASK, ROOM_MASK)
+
+# The envelope holds one card of each category
+ENVELOPE_SIZE = len(CATEGORY_MASKS)
+
+
+def card_mask(values):
+    """
+    Return the mask of the given card values, ignoring anything that isn't a card (like the Lobby)
+    """
+    mask = 0
+    for value in values:
+        card_id = CARD_IDS.get(value)
+        if card_id is not None:
+            mask |= 1 << card_id
+    return mask
+
+
+def mask_values(mask):
+    """
+    Return the values of the cards in a mask, in deck order
+    """
+    return [value for card_id, value in enumerate(CARD_VALUES) if mask >> card_id & 1]
+
+
+def count_cards(mask):
+    return bin(mask).count("1")
+
+
+class Deduction:
+    def __init__(self, hand_sizes):
+        """
+        Track what each player knows about who holds which card.
+        hand_sizes is the number of cards dealt to each seat, the envelope is
+        tracked as one more owner after the last seat.
+        """
+        self.envelope = len(hand_sizes)
+        self.sizes = list(hand_sizes) + [ENVELOPE_SIZE]
+
+        # For each owner, the cards it's known to have and known not to have
+        self.has = [0] * len(self.sizes)
+        self.lacks = [0] * len(self.sizes)
+
+        # (owner, mask) pairs: the owner has at least one of the cards in the mask
+        self.clauses = []
+
+    def set_hand(self, seat, values):
+        """
+        Record the cards dealt to seat, which are exactly the cards it holds
+        """
+        mask = card_mask(values)
+        self.has[seat] |= mask
+        self.lacks[seat] |= ALL_CARDS ^ mask
+        self.propagate()
+
+    def observe_suggestion(self, values, passed, refuter=None, shown=None):
+        """
+        Record a suggestion of the given card values. Every seat in passed
+        couldn't refute it; refuter (None if nobody did) showed a card, and
+        shown is that card's value if this player got to see it.
+        """
+        mask = card_mask(values)
+        for seat in passed:
+            self.lacks[seat] |= mask
+        if shown is not None:
+            self.has[refuter] |= card_mask([shown])
+        elif refuter is not None:
+            self.clauses.append((refuter, mask))
+        self.propagate()
+
+    def propagate(self):
+        """
+        Apply every rule until nothing new can be deduced
+        """
+        has = self.has
+        lacks = self.lacks
+        owners = range(len(self.sizes))
+        changed = True
+        while changed:
+            before = (tuple(has), tuple(lacks))
+
+            # A card has exactly one owner
+            for owner in owners:
+                lacked_by_others = ALL_CARDS
+                for other in owners:
+                    if other != owner:
+                        lacks[other] |= has[owner]
+                        lacked_by_others &= lacks[other]
+                has[owner] |= lacked_by_others & ~lacks[owner]
+
+            # The envelope has exactly one card of each category
+            envelope = self.envelope
+            for category in CATEGORY_MASKS:
+                if has[envelope] & category:
+                    lacks[envelope] |= category & ~has[envelope]
+                possible = category & ~lacks[envelope]
+                if count_cards(possible) == 1:
+                    has[envelope] |= possible
+
+            # Owners hold exactly as many cards as they were dealt
+            for owner in owners:
+                unknown = ALL_CARDS & ~has[owner] & ~lacks[owner]
+                if not unknown:
+                    continue
+                held = count_cards(has[owner])
+                if held == self.sizes[owner]:
+                    lacks[owner] |= unknown
+                elif held + count_cards(unknown) == self.sizes[owner]:
+                    has[owner] |= unknown
+
+            # A refuter has at least one of the cards it could have shown
+            remaining = []
+            for owner, mask in self.clauses:
+                if has[owner] & mask:
+                    continue
+                possible = mask & ~lacks[owner]
+                if count_cards(possible) == 1:
+                    has[owner] |= possible
+                else:
+                    remaining.append((owner, mask))
+            self.clauses = remaining
+
+            changed = before != (tuple(has), tuple(lacks))
+
+    def held_by_players(self):
+        """
+        Return the mask of cards known to be in some player's hand
+        """
+        mask = 0
+        for seat in range(self.envelope):
+            mask |= self.has[seat]
+        return mask
+
+    def candidates(self, category):
+        """
+        Return the mask of cards of a category that could still be in the envelope
+        """
+        return category & ~self.lacks[self.envelope]
+
+    def solution(self):
+        """
+        Return the (suspect, weapon, room) in the envelope once all three are known, otherwise None
+        """
+        envelope = self.has[self.envelope]
+        if all(envelope & category for category in CATEGORY_MASKS):
+            return tuple(mask_values(envelope))
+        return None
+
+    def pick(self, category, rng=random):
+        """
+        Pick a card of a category to suggest: the envelope's card if it's
+        known (so only the other cards can be refuted), otherwise a random
+        card (drawn from rng) that could still be in the envelope
+        """
+        candidates = self.candidates(category)
+        if not candidates:
+            candidates = category
+        return rng.choice(mask_values(candidates))
@@ -0,0 +1,33 @@
+import random
+
+
+class Die:
+    def __init__(self):
+        # Initialize die value
+        self.value = 1
+        self.final_value = 1
+        self.spaces_remaining = self.final_value
+
+        # Stream the rolls are drawn from, the game gives the die its own
+        self.rng = random
+
+    def roll(self):
+        """
+        Roll the die and return the value rolled
+        """
+        return self.show(self.draw())
+
+    def draw(self):
+        """
+        Roll a value without showing it on the die, to show it later with show
+        """
+        return self.rng.randint(1, 6)
+
+    def show(self, value):
+        """
+        Show a value rolled with draw on the die and return it
+        """
+        self.final_value = value
+        self.value = self.final_value
+        self.spaces_remaining = self.final_value
+        return self.final_value
@@ -0,0 +1,101 @@
+# Structured log of what happens in a game: each event is the turn, the actor,
+# the kind of event and its details, kept only at or above the log's level
+import json
+
+# Levels of events, a log at OFF keeps nothing
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "off": OFF}
+LEVEL_NAMES = {level: name for name, level in LEVELS.items()}
+
+# Bytes the file sink buffers before writing to disk
+FILE_BUFFER_SIZE = 1 << 16
+
+
+def ignore(actor, event, **payload):
+    """Logger for a level below the log's, does nothing"""
+
+
+def as_json(value):
+    """Return the JSON form of payload values json can't write, paths and cards"""
+    try:
+        return list(value)
+    except TypeError:
+        return str(value)
+
+
+class ConsoleSink:
+    def write(self, turn, level, actor, event, payload):
+        details = " ".join(f"{key}={value}" for key, value in payload.items())
+        print(f"[turn {turn}] {LEVEL_NAMES[level].upper()} {actor or '-'}: {event} {details}".rstrip())
+
+    def close(self):
+        pass
+
+
+class FileSink:
+    def __init__(self, file_name):
+        """
+        Write events to a file as JSON lines, buffered so tracing a game
+        doesn't write to disk on every event. Close it to flush the rest
+        """
+        self.file = open(file_name, "w", buffering=FILE_BUFFER_SIZE)
+
+    def write(self, turn, level, actor, event, payload):
+        record = {"turn": turn, "level": LEVEL_NAMES[level], "actor": actor, "event": event, "payload": payload}
+        self.file.write(json.dumps(record, default=as_json) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class EventLog:
+    def __init__(self, level=INFO, sink=None):
+        """
+        Log events at level and above to sink (the console by default).
+        Log with debug, info and warning, each called with the actor (a
+        character name, or None for the game itself), the event and its
+        details as keywords. Pass the details as they are, they're only
+        formatted when the event is kept
+        """
+        self.sink = sink or ConsoleSink()
+        self.turn = 0
+        self.set_level(level)
+
+    def set_level(self, level):
+        """
+        Keep events at level and above. The loggers of lower levels are
+        swapped for one that does nothing, so a disabled event costs a call
+        """
+        self.level = level
+        self.debug = self.make_logger(DEBUG)
+        self.info = self.make_logger(INFO)
+        self.warning = self.make_logger(WARNING)
+
+    def make_logger(self, level):
+        if level < self.level:
+            return ignore
+
+        def log(actor, event, **payload):
+            self.sink.write(self.turn, level, actor, event, payload)
+        return log
+
+    def enabled(self, level):
+        """Return True if events at level are kept, to skip building costly details"""
+        return level >= self.level
+
+    def set_sink(self, sink):
+        """Send events to sink from now on, closing the one before"""
+        self.sink.close()
+        self.sink = sink
+
+    def close(self):
+        """Flush and close the sink, events go to the console after this"""
+        self.set_sink(ConsoleSink())
+
+
+# Log shared by every game in the process
+event_log = EventLog()
@@ -0,0 +1,365 @@
+# The turn state machine tying the board, pieces, deck and die together
+from engine.board import Board, COLUMN_COUNT
+from engine.cards import Deck
+from engine.dice import Die
+from engine.eventlog import event_log
+from engine.notes import Notes
+from engine.pieces import HumanPiece, ComputerPiece
+from engine.planner import PathPlanner, plan_move, hallway_locations, blocked_squares
+from engine.rng import GameRandom, DEAL, DICE, SEATS, ai_stream
+
+# Starting square (row, col) of every character
+STARTING_POSITIONS = {
+    "Miss Scarlet": (23, 16),
+    "Colonel Mustard": (16, 23),
+    "Mrs. White": (23, 7),
+    "Mr. Green": (6, 23),
+    "Mrs. Peacock": (5, 0),
+    "Professor Plum": (18, 0)
+}
+
+# Door an AI heads to once it's ready to make an accusation
+LOBBY_GOAL = (16, 11, "Lobby")
+
+# Kinds of action an AI can take at the end of its turn
+SUGGEST = "SUGGEST"
+ACCUSE = "ACCUSE"
+
+
+class Game:
+    def __init__(self, character_name=None, num_players=4, seed=None):
+        """
+        Set up a game for the human playing character_name against AIs.
+        With no character_name every seat is played by an AI.
+        Every random choice in the game is drawn from streams seeded by seed
+        (a new one when it's None), so the same seed plays the same game.
+        """
+        self.num_players = num_players
+        self.random = GameRandom(seed)
+        event_log.turn = 0
+        event_log.info(None, "seed", seed=self.random.seed)
+
+        # Create the board and the die
+        self.board = self.make_board()
+        self.die = self.make_die()
+        self.die.rng = self.random.stream(DICE)
+
+        # Keep track of whose turn it currently is (seat 0 is the user, if there is one)
+        self.whose_turn = [True] + [False] * (num_players - 1)
+        self.turn_count = 0
+        self.game_over = False
+
+        # Roll, start, goal, path and blocked squares of every AI whose move this
+        # round has been planned but who hasn't had its turn yet, by seat
+        self.round_plan = {}
+        self.winner = None
+
+        # Create the player piece, then give the AIs random characters from those left
+        characters = dict(STARTING_POSITIONS)
+        self.players = []
+        self.human = None
+        if character_name is not None:
+            start_row, start_column = characters.pop(character_name)
+            self.human = self.make_human(character_name, start_row, start_column)
+            self.players.append(self.human)
+        while len(self.players) < num_players:
+            ai_name, (start_row, start_column) = self.random.stream(SEATS).choice(list(characters.items()))
+            ai = self.make_computer(ai_name, start_row, start_column)
+            ai.rng = self.random.stream(ai_stream(len(self.players)))
+            self.players.append(ai)
+            del characters[ai_name]
+
+        # Create the deck and deal out the cards
+        self.deck = self.make_deck()
+        self.deck.deal(num_players, self.random.stream(DEAL))
+        self.all_decks = self.deck.get_all_cards()
+        self.killer = self.deck.get_killer()
+
+        # Every seat's notesheet, the human's in seat 0 if there is one
+        self.notes = Notes(num_players)
+
+        # Start each AI's deduction from the cards in its hand, on its own notesheet
+        hand_sizes = [len(deck) for deck in self.all_decks]
+        for seat, player in enumerate(self.players):
+            if player is not self.human:
+                player.notes = self.notes.sheet(seat)
+                player.deal_hand(seat, self.all_decks[seat], hand_sizes)
+
+    def make_board(self):
+        return Board()
+
+    def make_die(self):
+        return Die()
+
+    def make_deck(self):
+        return Deck()
+
+    def make_human(self, character_name, start_row, start_column):
+        return HumanPiece(character_name, start_row, start_column)
+
+    def make_computer(self, character_name, start_row, start_column):
+        return ComputerPiece(character_name, start_row, start_column)
+
+    def current_seat(self):
+        """
+        Return the seat number of the player whose turn it is
+        """
+        return self.whose_turn.index(True)
+
+    def next_turn(self):
+        """
+        Pass the turn on to the next seat
+        """
+        seat = self.current_seat()
+        self.whose_turn[seat] = False
+        self.whose_turn[(seat + 1) % self.num_players] = True
+        self.turn_count += 1
+        event_log.turn = self.turn_count
+
+    def check_accusation(self, guess):
+        """
+        Return True if every card guessed is one of the killer cards
+        """
+        killer_values = [answer.value for answer in self.killer]
+        for card in guess:
+            if card not in killer_values:
+                return False
+        return True
+
+    def move_ai(self, seat):
+        """
+        Roll for the AI in the given seat and move it up to that many spaces along
+        its path to its goal room, following the round's plan (see plan_round)
+        """
+        plan = self.round_plan.pop(seat, None)
+        if plan is None:
+            self.plan_round()
+            plan = self.round_plan.pop(seat)
+        roll, start, goal, path, blocked = plan
+
+        ai = self.players[seat]
+        ai.spaces_remaining = self.die.show(roll)
+        event_log.debug(ai.character_name, "roll", spaces=roll)
+
+        # If the AI is currently in a room, exit it by the door it planned to, or by
+        # another free one if a piece has stepped onto that door since
+        planned_start = start
+        if ai.within_a_room(self.board):
+            if start is None or self.board.is_occupied(start):
+                start = self.choose_exit(ai, hallway_locations(self.board))
+            if start is None:
+                event_log.debug(ai.character_name, "wait in room")
+                ai.spaces_remaining = 0
+                return
+            ai.move(start, self.board)
+            ai.spaces_remaining -= 1
+            event_log.debug(ai.character_name, "leave room", square=start)
+
+        # The plan holds if the AI is still heading for the same goal and the other
+        # pieces are where it expected. Otherwise an AI that went before didn't
+        # end up where it planned to, or someone's suggestion changed this AI's
+        # goal, so plan again from here
+        if (start != planned_start or ai.goal != goal
+                or blocked_squares(hallway_locations(self.board), ai.character_name) != blocked):
+            event_log.debug(ai.character_name, "replan")
+            self.choose_goal(ai, start, ai.spaces_remaining)
+            path = ai.planner.path(start, ai.spaces_remaining)
+        self.finish_ai_move(ai, path)
+
+    def plan_round(self):
+        """
+        Plan the moves of the AIs taking the next turns in a row, from the
+        current seat up to the human's seat or once round the table.
+        Each AI's roll is drawn, and its goal picked, from where it will set
+        off: its square, or the door it leaves its room by, without moving it
+        before its turn. Each path is planned around where the AIs before it
+        will be (see plan_move), and the plans are kept in round_plan until
+        each AI's turn comes
+        """
+        locations = hallway_locations(self.board)
+        self.round_plan = {}
+        for offset in range(self.num_players):
+            seat = (self.current_seat() + offset) % self.num_players
+            ai = self.players[seat]
+            if ai is self.human:
+                break
+
+            roll = spaces = self.die.draw()
+            start = (ai.row, ai.column)
+            if ai.within_a_room(self.board):
+                start = self.choose_exit(ai, locations)
+                spaces -= 1
+            if start is None:
+                # every door is taken, the AI waits in the room
+                self.round_plan[seat] = (roll, None, ai.goal, None, None)
+                continue
+
+            self.choose_goal(ai, start, spaces)
+            path, blocked = plan_move(locations, ai.character_name, ai.planner, start, spaces)
+            self.round_plan[seat] = (roll, start, ai.goal, path, blocked)
+
+    def choose_exit(self, ai, locations):
+        """
+        Return the first door (row, col) out of the AI's room that no other
+        piece is on, given their hallway_locations, or None if every door is taken
+        """
+        taken = blocked_squares(locations, ai.character_name)
+        for door in self.board.get_doors(ai.get_room(self.board)):
+            row, col = door.boundaries
+            if row * COLUMN_COUNT + col not in taken:
+                return door.boundaries
+        return None
+
+    def choose_goal(self, ai, start, spaces):
+        """
+        Pick the AI's goal, if it has none or is at it, setting off from start
+        with the given number of spaces, and set up its planner for the goal
+        """
+        # if no goal or the goal is reached, select a new goal
+        if ai.goal is None or ai.has_reached_goal(self.board, start):
+            if ai.ready_to_accuse:
+                # keep heading for the middle room until the AI gets to accuse
+                goal_row, goal_col, goal_room = LOBBY_GOAL
+            else:
+                # select a new goal room out of those that could still be the murder room,
+                # preferring one the AI can get into with this roll
+                goal_rooms = ai.goal_rooms()
+                goal = self.board.get_goal_in_reach(start, spaces, goal_rooms, ai.rng)
+                goal_row, goal_col, goal_room = goal or self.board.get_random_goal(goal_rooms, ai.rng)
+            ai.goal = (goal_row, goal_col, goal_room)
+            event_log.debug(ai.character_name, "new goal", room=goal_room, square=(goal_row, goal_col))
+
+        # plan paths to whichever door of the goal room is nearest with the AI's planner,
+        # which repairs its last search if it's still heading for the same room
+        goal_row, goal_col, goal_room = ai.goal
+        goal_doors = [door.boundaries for door in self.board.get_doors(goal_room)]
+        if ai.planner is None or ai.planner.goals != frozenset(goal_doors):
+            ai.planner = PathPlanner(self.board, goal_doors)
+
+    def finish_ai_move(self, ai, path):
+        """
+        Walk the AI along its planned path and into its goal room if it gets there
+        """
+        goal_row, goal_col, goal_room = ai.goal
+        if path is not None:
+            event_log.debug(ai.character_name, "path", room=goal_room, path=path)
+        else:
+            # other pieces are blocking the way, step out of the way of the others in
+            # case they're waiting on this AI too and pick a different goal next turn
+            event_log.debug(ai.character_name, "no path", room=goal_room)
+            self.step_aside(ai)
+            ai.goal = None
+            return
+
+        # move the AI along the path, stopping short if a piece that couldn't
+        # follow its own path stepped in the way since this one was planned
+        moved = bool(path)
+        while ai.spaces_remaining > 0 and path and not self.board.is_occupied(path[0]):
+            ai.move(path.popleft(), self.board)
+            ai.spaces_remaining -= 1
+
+        # check if AI is at a door of the goal room, having walked there or with a space left to go in
+        goal_doors = {door.boundaries: door for door in self.board.get_doors(goal_room)}
+        if (ai.row, ai.column) in goal_doors and (moved or ai.spaces_remaining > 0):
+            # determine the room entry position of the goal room's door, (16, 11) is a door
+            # into both the Hall and the Lobby
+            room_entry = goal_doors[(ai.row, ai.column)].get_room_entry_position()
+            event_log.debug(ai.character_name, "enter room", room=goal_room, square=room_entry)
+            ai.move(room_entry, self.board)  # move into the room
+            ai.spaces_remaining = 0  # stop further movement
+
+        # if the AI has reached its goal, clear the goal
+        if ai.has_reached_goal(self.board):
+            event_log.debug(ai.character_name, "reached goal", room=goal_room)
+            ai.goal = None
+
+    def step_aside(self, ai):
+        """
+        Move the AI onto free hallway squares at random for the rest of its spaces
+        """
+        neighbors = self.board.topology.hallway_neighbors
+        while ai.spaces_remaining > 0:
+            free = [divmod(node, COLUMN_COUNT) for node in neighbors[ai.row * COLUMN_COUNT + ai.column]]
+            free = [square for square in free if not self.board.is_occupied(square)]
+            if not free:
+                break
+            ai.move(ai.rng.choice(free), self.board)
+            ai.spaces_remaining -= 1
+
+    def observe_suggestion(self, suggester, guessed_cards, passed, refuter, refute_card):
+        """
+        Let every AI deduce what it can from a suggestion. The seats in passed
+        couldn't refute it and refuter (None if nobody did) showed refute_card
+        to the suggester only.
+        An AI that has solved the case heads to the middle room to accuse.
+        """
+        for seat, player in enumerate(self.players):
+            if player is self.human:
+                continue
+            shown_card = refute_card if seat == suggester else None
+            if player.observe_suggestion(guessed_cards, passed, refuter, shown_card):
+                player.goal = LOBBY_GOAL
+
+    def take_ai_action(self, seat):
+        """
+        Have the AI in the given seat accuse if it's ready (and able) to,
+        otherwise make a suggestion if it's in a room.
+        Returns (ACCUSE or SUGGEST, cards), or None if the AI did neither.
+        """
+        ai = self.players[seat]
+        current_room = ai.get_room(self.board)
+
+        # only allow accusation while in middle room
+        if ai.ready_to_accuse and current_room == "Lobby":
+            event_log.info(ai.character_name, "accuse", cards=ai.accuse_cards)
+
+            # The game ends when an AI makes an accusation (they only accuse once the
+            # envelope is deduced, so they will always be right)
+            self.game_over = True
+            self.winner = seat
+            return ACCUSE, ai.accuse_cards
+
+        # make a suggestion if AI is in a room
+        if ai.within_a_room(self.board):
+            ai_guessed_cards = ai.make_ai_suggestion()
+            refuter, refute_card = self.deck.find_refuter(ai_guessed_cards, self.all_decks)
+            event_log.info(ai.character_name, "suggest", cards=ai_guessed_cards, refuter=refuter)
+            if refuter is None:
+                passed = range(self.num_players)
+            else:
+                passed = range(refuter)
+            self.observe_suggestion(seat, ai_guessed_cards, passed, refuter, refute_card)
+            return SUGGEST, ai_guessed_cards
+
+        return None
+
+    def play_ai_turn(self):
+        """
+        Roll, move and then suggest or accuse for the AI whose turn it is
+        """
+        seat = self.current_seat()
+        self.move_ai(seat)
+        return self.take_ai_action(seat)
+
+    def play_round(self, max_turns=None):
+        """
+        Play a turn for every seat, starting with the one whose turn it is.
+        Stops early when the game ends or max_turns turns have passed.
+        """
+        for _ in range(self.num_players):
+            if self.game_over or (max_turns is not None and self.turn_count >= max_turns):
+                return
+            self.play_ai_turn()
+            self.next_turn()
+
+    def run(self, max_turns=None):
+        """
+        Play AI rounds until one of them accuses or max_turns turns have passed.
+        Returns the seat of the winning AI, or None if nobody won.
+        """
+        if self.human is not None:
+            raise ValueError("A game with a human player can't be run headless")
+
+        while not self.game_over and (max_turns is None or self.turn_count < max_turns):
+            self.play_round(max_turns)
+        return self.winner
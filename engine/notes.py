@@ -0,0 +1,66 @@
+# Notesheet states and the notesheets players use to track what they know
+from enum import Enum
+
+from engine.deduction import CARD_VALUES
+
+# Initialize list of names for suspects, weapons, and rooms
+SUSPECTS = ["Miss Scarlet", "Colonel Mustard", "Mrs. White", "Mr. Green", "Mrs. Peacock", "Professor Plum"]
+WEAPONS = ["Candlestick", "Knife", "Lead Pipe", "Revolver", "Rope", "Wrench"]
+ROOMS = ["Kitchen", "Ball Room", "Conservatory", "Dining Room", "Lounge", "Hall", "Study", "Library", "Billiard Room"]
+
+# Sections of a notesheet in the order they're shown, each card in the order it's listed
+SECTIONS = {"Suspects": SUSPECTS, "Weapons": WEAPONS, "Rooms": ROOMS}
+
+# Boxes on a notesheet, one per card
+CARD_COUNT = len(CARD_VALUES)
+
+
+# Different notesheet states
+class NotesheetBox(Enum):
+    BLANK = 0
+    MARKED = 1
+    SUGGEST = 2
+    ACCUSE = 3
+
+    def next(self):
+        return BOXES[(self.value + 1) % len(BOXES)]
+
+
+# Every state, indexed by its value
+BOXES = list(NotesheetBox)
+
+
+class Notes:
+    def __init__(self, num_sheets):
+        """
+        The notesheets of every seat in one bytearray, a row of CARD_COUNT
+        boxes per seat indexed by card id (see CARD_IDS), each box holding
+        the value of its NotesheetBox. Every box starts BLANK
+        """
+        self.num_sheets = num_sheets
+        self.boxes = bytearray(num_sheets * CARD_COUNT)
+
+    def sheet(self, seat):
+        """
+        Return a seat's row as a memoryview, writes to it change the notes in place
+        """
+        return memoryview(self.boxes)[seat * CARD_COUNT:(seat + 1) * CARD_COUNT]
+
+    def get(self, seat, card_id):
+        return BOXES[self.boxes[seat * CARD_COUNT + card_id]]
+
+    def set(self, seat, card_id, box):
+        self.boxes[seat * CARD_COUNT + card_id] = box.value
+
+    def cycle(self, seat, card_id):
+        """
+        Move a box on to the next state, back to BLANK after ACCUSE, and return the new state
+        """
+        index = seat * CARD_COUNT + card_id
+        self.boxes[index] = (self.boxes[index] + 1) % len(BOXES)
+        return BOXES[self.boxes[index]]
+
+    def copy(self):
+        notes = Notes(self.num_sheets)
+        notes.boxes[:] = self.boxes
+        return notes
@@ -0,0 +1,256 @@
+# Player pieces: the rules for moving a human's piece and the AI's decisions
+import random
+
+from engine.board import NO_ROOM, get_topology
+from engine.deduction import Deduction, CARD_IDS, SUSPECT_MASK, WEAPON_MASK, ROOM_MASK, mask_values
+from engine.eventlog import event_log
+from engine.notes import Notes, NotesheetBox, CARD_COUNT
+
+# Set opposites for leaving a room
+OPPOSITES = {"UP": "DOWN",
+             "DOWN": "UP",
+             "LEFT": "RIGHT",
+             "RIGHT": "LEFT"}
+
+
+class Piece:
+    def __init__(self, character_name, start_row, start_column):
+        """
+        Initialize the piece at its starting square
+        """
+        self.character_name = character_name
+
+        # Initial position
+        self.row = start_row
+        self.column = start_column
+
+    def update_position(self):
+        """
+        Called whenever the piece's row or column changes, renderers override
+        this to move their sprite
+        """
+
+    def within_a_room(self, board):
+        """Check if the player is inside a room"""
+        return board.get_room_id((self.row, self.column)) != NO_ROOM
+
+    def get_room(self, board):
+        """Check if the player is inside a room"""
+        return board.get_room((self.row, self.column)) or "N/A"
+
+
+class HumanPiece(Piece):
+    def __init__(self, character_name, start_row, start_column):
+        """
+        Initialize the player piece.
+        """
+        super().__init__(character_name, start_row, start_column)
+
+        self.entered_room_this_turn = False
+
+    def reset_room_entry_flag(self):
+        """Reset the entered_room_this_turn flag for the new turn."""
+        self.entered_room_this_turn = False
+
+    def move(self, d_row, d_column, board, direction):
+        """
+        Move the player by a row or column delta, but check room boundaries and door access.
+        Direction is the key pressed, one of "UP", "DOWN", "LEFT" or "RIGHT".
+        """
+        new_row = self.row + d_row
+        new_column = self.column + d_column
+
+        # Check if the player is attempting to enter or exit a room through a non-door point
+        current_in_room, current_room = self.check_room_collision(self.row, self.column, board)
+        new_in_room, new_room = self.check_room_collision(new_row, new_column, board)
+
+        # Check for collisions with other players
+        if board.is_occupied((new_row, new_column)) and not current_in_room:
+            event_log.debug(self.character_name, "blocked", square=(new_row, new_column))
+            return  # Stop movement due to collision
+
+        # Leaving room case
+        if current_in_room and not new_in_room:
+            if self.entered_room_this_turn:
+                return # stop movement
+            if (new_row, new_column, OPPOSITES[direction]) in board.doors_by_entry:
+                self.step_to(new_row, new_column, board)
+            event_log.debug(self.character_name, "leave room", square=(self.row, self.column))
+            return
+
+        # Entering room case
+        if not current_in_room and new_in_room:
+            self.entered_room_this_turn = True
+            if (self.row, self.column, direction) in board.doors_by_entry:
+                self.step_to(new_row, new_column, board)
+            event_log.debug(self.character_name, "enter room", square=(self.row, self.column))
+            return
+
+        # Free movement within the same space (either inside a room or outside)
+        if current_in_room == new_in_room and current_room == new_room:
+            self.step_to(new_row, new_column, board)
+            event_log.debug(self.character_name, "move", square=(self.row, self.column))
+
+    def step_to(self, new_row, new_column, board):
+        """
+        Put the piece on a new square and tell the board it moved
+        """
+        self.row = new_row
+        self.column = new_column
+        board.move_piece(self.character_name, (self.row, self.column))
+        self.update_position()
+
+    def check_room_collision(self, new_row, new_column, board):
+        """Check if the player is attempting to move into a wall or within room boundaries."""
+        room_id = board.get_room_id((new_row, new_column))
+        if room_id != NO_ROOM:
+            return True, board.rooms[room_id]  # Valid move within a room
+        return False, None  # Invalid move through a wall
+
+
+class ComputerPiece(Piece):
+    def __init__(self, character_name, start_row, start_column):
+        """
+        Initialize the player piece.
+        """
+        super().__init__(character_name, start_row, start_column)
+
+        # Current goal (row, col, room_name) and the planner for the path to it
+        self.goal = None
+        self.planner = None
+
+        self.spaces_remaining = 0
+
+        # Create variables for suggestion/accusations
+        self.suspect_guess = ""
+        self.weapon_guess = ""
+        self.room_guess = ""
+
+        # Keep track of the rooms and doors through the shared board topology
+        self.topology = get_topology()
+
+        # Keep track of what the AI knows on its own note sheet, in memory. The game
+        # gives it its seat's row of the game's notes
+        self.notes = Notes(1).sheet(0)
+
+        # What the AI has worked out about every hand, set up once the cards are dealt
+        self.deduction = None
+
+        self.ready_to_accuse = False
+        self.accuse_cards = []
+
+        # Stream the AI's random choices are drawn from, the game gives every AI its own
+        self.rng = random
+
+    def move(self, coordinate, board):
+        self.row, self.column = coordinate
+        board.move_piece(self.character_name, coordinate)
+
+        self.update_position()
+
+    def has_reached_goal(self, board, position=None):
+        """
+        Check if the AI has reached its goal, either by being at the door or inside the room.
+        position is the (row, col) to check from, by default the AI's own square
+        """
+        # return false is no goal is set
+        if self.goal is None:
+            return False
+
+        # initialize goal components
+        goal_row, goal_col, goal_room = self.goal
+        row, column = position or (self.row, self.column)
+
+        # check if AI is at the door
+        if row == goal_row and column == goal_col:
+            return True
+
+        # check if AI is inside the room
+        current_room = board.get_room((row, column))
+        if current_room == goal_room:
+            return True
+
+        # goal has not been reached
+        return False
+
+    def deal_hand(self, seat, cards, hand_sizes):
+        """
+        Start the AI's deduction from the cards dealt to it in the given seat.
+        hand_sizes is the number of cards dealt to every seat.
+        """
+        self.deduction = Deduction(hand_sizes)
+        self.deduction.set_hand(seat, [card.value for card in cards])
+        self.update_notes()
+
+    def observe_suggestion(self, guessed_cards, passed, refuter, shown_card=None):
+        """
+        Record a suggestion made by any player: the seats in passed couldn't
+        refute it, refuter (None if nobody did) showed a card, and shown_card
+        is that card if this AI was the one shown it.
+        Returns True if this suggestion solved the case for the AI.
+        """
+        shown = shown_card.value if shown_card is not None else None
+        self.deduction.observe_suggestion(guessed_cards, passed, refuter, shown)
+        self.update_notes()
+
+        solution = self.deduction.solution()
+        if solution is None or self.ready_to_accuse:
+            return False
+        suspect, weapon, room = solution
+        self.accuse_cards = (suspect, room, weapon)
+        self.record_accusation(self.accuse_cards)
+        self.ready_to_accuse = True
+        return True
+
+    def update_notes(self):
+        """
+        Mark every card the AI knows is in someone's hand on its note sheet
+        """
+        held = self.deduction.held_by_players()
+        for card_id in range(CARD_COUNT):
+            if held >> card_id & 1:
+                self.notes[card_id] = NotesheetBox.MARKED.value
+
+    def record_accusation(self, accuse_cards):
+        """
+        Mark the cards the AI is going to accuse with as ACCUSE on its note sheet
+        """
+        for value in accuse_cards:
+            self.notes[CARD_IDS[value]] = NotesheetBox.ACCUSE.value
+
+    def goal_rooms(self):
+        """
+        Return the names of the rooms that could still be the murder room
+        """
+        return mask_values(self.deduction.candidates(ROOM_MASK))
+
+    def move_out_of_room(self, board):
+        current_room = self.get_room(self.topology)
+        if current_room != "N/A":
+            # Find the nearest door to exit the room
+            for door in board.get_doors(current_room):
+                self.move(door.boundaries, board)
+                break
+
+    def make_ai_suggestion(self):
+        """
+        Pick a suggestion for the room the AI is in from the suspects and
+        weapons it hasn't ruled out
+        """
+        # Make sure the AI is within a room AND set that room to their suggestion
+        current_room = self.get_room(self.topology)
+
+        # If AI is not currently in a room, then don't make a guess
+        if current_room == "N/A":
+            event_log.warning(self.character_name, "suggest outside a room", square=(self.row, self.column))
+            return None
+
+        # Set the room guess to the current room
+        self.room_guess = current_room
+
+        # Suggest the suspect and weapon that could still be in the envelope
+        self.suspect_guess = self.deduction.pick(SUSPECT_MASK, self.rng)
+        self.weapon_guess = self.deduction.pick(WEAPON_MASK, self.rng)
+
+        # Make the suggestion and return those cards (so the game can call deck functions)
+        return self.suspect_guess, self.room_guess, self.weapon_guess
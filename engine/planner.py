@@ -0,0 +1,206 @@
+# Incremental path planning for the AI (D* Lite). The search is kept between
+# turns and only the squares whose cost changed as other pieces moved are repaired
+import heapq
+from collections import deque
+
+from engine.board import COLUMN_COUNT, NO_ROOM
+
+INFINITY = float("inf")
+
+
+class PathPlanner:
+    def __init__(self, board, goals):
+        """
+        Plan paths along the hallways to the nearest of goals, door squares
+        given as (row, col). The search runs backwards from the goals, so the
+        start can move from turn to turn without starting over.
+        """
+        self.board = board
+        self.neighbors = board.topology.hallway_neighbors
+        self.goals = frozenset(goals)
+        self.goal_nodes = frozenset(row * COLUMN_COUNT + col for row, col in self.goals)
+
+        # Set on the first call to path
+        self.start_node = None
+        self.last_node = None
+        self.key_modifier = 0
+
+        # Cost to the goal of every node searched so far, and its one step lookahead
+        self.g = {}
+        self.rhs = dict.fromkeys(self.goal_nodes, 0)
+
+        # Priority queue of inconsistent nodes. Entries are never removed from the heap,
+        # queued holds the current key of every node in it and stale entries are skipped
+        self.queue = []
+        self.queued = {}
+
+        # Squares other pieces are standing on
+        self.blocked = set()
+
+        # Number of nodes expanded over every search, to compare against a fresh A*
+        self.expansions = 0
+
+    def heuristic(self, node, other):
+        """Manhattan distance between two squares"""
+        return abs(node // COLUMN_COUNT - other // COLUMN_COUNT) + abs(node % COLUMN_COUNT - other % COLUMN_COUNT)
+
+    def calculate_key(self, node):
+        best = min(self.g.get(node, INFINITY), self.rhs.get(node, INFINITY))
+        return best + self.heuristic(self.start_node, node) + self.key_modifier, best
+
+    def update_node(self, node):
+        """
+        Recompute a node's lookahead cost and queue it if it's inconsistent
+        """
+        if node not in self.goal_nodes:
+            best = INFINITY
+            for neighbor in self.neighbors[node]:
+                if neighbor not in self.blocked:
+                    cost = self.g.get(neighbor, INFINITY) + 1
+                    if cost < best:
+                        best = cost
+            self.rhs[node] = best
+
+        if self.g.get(node, INFINITY) != self.rhs.get(node, INFINITY):
+            key = self.calculate_key(node)
+            self.queued[node] = key
+            heapq.heappush(self.queue, (key, node))
+        else:
+            self.queued.pop(node, None)
+
+    def top_key(self):
+        """Return the smallest key in the queue, dropping stale entries"""
+        while self.queue:
+            key, node = self.queue[0]
+            if self.queued.get(node) == key:
+                return key
+            heapq.heappop(self.queue)
+        return INFINITY, INFINITY
+
+    def compute_shortest_path(self):
+        start = self.start_node
+        while (self.top_key() < self.calculate_key(start)
+               or self.rhs.get(start, INFINITY) != self.g.get(start, INFINITY)):
+            if not self.queue:
+                break
+            old_key, node = heapq.heappop(self.queue)
+            del self.queued[node]
+            self.expansions += 1
+
+            new_key = self.calculate_key(node)
+            if old_key < new_key:
+                # the key was out of date, put the node back in its place
+                self.queued[node] = new_key
+                heapq.heappush(self.queue, (new_key, node))
+            elif self.g.get(node, INFINITY) > self.rhs[node]:
+                self.g[node] = self.rhs[node]
+                for neighbor in self.neighbors[node]:
+                    self.update_node(neighbor)
+            else:
+                self.g[node] = INFINITY
+                self.update_node(node)
+                for neighbor in self.neighbors[node]:
+                    self.update_node(neighbor)
+
+    def path(self, start, limit=None, blocked=None):
+        """
+        Return the steps from start (a hallway square) to the nearest goal as a deque
+        of (row, col), not including start and at most limit long, or None if
+        other pieces block every way there.
+        blocked is the set of squares (row * COLUMN_COUNT + col) other pieces are on,
+        by default every location on the board but start.
+        """
+        start_node = start[0] * COLUMN_COUNT + start[1]
+        if blocked is None:
+            blocked = {row * COLUMN_COUNT + col for row, col in self.board.player_locations.values()}
+            blocked.discard(start_node)
+
+        if self.start_node is None:
+            # first search
+            self.start_node = self.last_node = start_node
+            self.blocked = blocked
+            for goal_node in self.goal_nodes:
+                self.update_node(goal_node)
+        else:
+            self.start_node = start_node
+            if start_node != self.last_node:
+                # keys in the queue were worked out from the old start, raise the
+                # keys of new nodes to match instead of requeueing them all
+                self.key_modifier += self.heuristic(self.last_node, start_node)
+                self.last_node = start_node
+            changed = self.blocked ^ blocked
+            if changed:
+                # the squares around pieces that moved changed cost, repair just those
+                self.blocked = blocked
+                for node in changed:
+                    for neighbor in self.neighbors[node]:
+                        self.update_node(neighbor)
+
+        self.compute_shortest_path()
+        if self.g.get(start_node, INFINITY) == INFINITY:
+            return None
+
+        # follow the cheapest neighbor down to the goal, never coming back to a
+        # square already on the path in case the costs are out of step
+        steps = deque()
+        node = start_node
+        visited = {start_node}
+        while node not in self.goal_nodes and (limit is None or len(steps) < limit):
+            next_node = min((neighbor for neighbor in self.neighbors[node] if neighbor not in blocked),
+                            key=lambda neighbor: self.g.get(neighbor, INFINITY), default=None)
+            if next_node is None or next_node in visited or self.g.get(next_node, INFINITY) == INFINITY:
+                return None
+            visited.add(next_node)
+            steps.append(divmod(next_node, COLUMN_COUNT))
+            node = next_node
+        return steps
+
+
+def hallway_locations(board):
+    """
+    Return the square (row * COLUMN_COUNT + col) of every piece on the board,
+    or None for a piece inside a room, where it can't be in anyone's way
+    """
+    return {name: None if board.get_room_id((row, col)) != NO_ROOM else row * COLUMN_COUNT + col
+            for name, (row, col) in board.player_locations.items()}
+
+
+def blocked_squares(locations, character_name):
+    """
+    Return the squares pieces other than character_name are on, given their
+    hallway_locations
+    """
+    return {node for name, node in locations.items() if name != character_name and node is not None}
+
+
+def plan_move(locations, character_name, planner, start, limit):
+    """
+    Plan one piece's move from start (row, col), the door it leaves its room
+    by if it's in one, around the other pieces at their hallway_locations.
+    locations is updated to where the move ends, off the hallways once the
+    piece goes into a room, for the pieces that move after it.
+    Returns the path (see PathPlanner.path) and the squares it was planned
+    around, to tell whether the plan still holds once the piece's turn comes.
+    """
+    blocked = blocked_squares(locations, character_name)
+    path = planner.path(start, limit, blocked)
+
+    end = start if not path else path[-1]
+    if path is not None and end in planner.goals and (path or limit > 0):
+        locations[character_name] = None
+    else:
+        locations[character_name] = end[0] * COLUMN_COUNT + end[1]
+    return path, blocked
+
+
+def plan_paths(board, moves):
+    """
+    Plan the moves of several pieces taking their turns one after another in
+    a single pass. moves is a list of (character_name, planner, start, limit)
+    in turn order. Every piece plans around the squares the pieces before it
+    will end their moves on and the squares of the pieces after it, which
+    haven't moved yet.
+    Returns (path, blocked) for every move, in order (see plan_move).
+    """
+    locations = hallway_locations(board)
+    return [plan_move(locations, *move) for move in moves]
@@ -0,0 +1,66 @@
+# Seeded random number streams for a game. Every kind of random choice draws
+# from its own stream, so a game replays exactly from its seed and one kind
+# of choice never shifts another (an extra die roll doesn't change the deal)
+import random
+
+# Stream names, the AI in seat k draws from ai_stream(k)
+DEAL = "deal"
+DICE = "dice"
+SEATS = "seats"
+
+# Faces the die shows while it's rolling on screen
+DIE_ANIMATION = "die animation"
+
+# Seeds have to fit in the signed 64 bits a snapshot keeps them in
+MIN_SEED = -2 ** 63
+MAX_SEED = 2 ** 63 - 1
+
+
+def ai_stream(seat):
+    """Return the name of the stream of the AI in a seat"""
+    return f"ai {seat}"
+
+
+class GameRandom:
+    def __init__(self, seed=None):
+        """
+        Set up the streams of a game from seed, between MIN_SEED and MAX_SEED.
+        With no seed a new one is drawn from the operating system, kept in
+        self.seed to replay the game
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        elif not MIN_SEED <= seed <= MAX_SEED:
+            raise ValueError(f"Seed must be between {MIN_SEED} and {MAX_SEED}, not {seed}")
+        self.seed = seed
+        self.streams = {}
+
+        # Turn the game was resumed at from a snapshot, None if it wasn't
+        self.resumed_at = None
+
+    def stream(self, name):
+        """
+        Return the random.Random of a stream, created the first time it's asked for.
+        Each stream is seeded from the game's seed and its name, so it's the
+        same whatever other streams were made or used before it
+        """
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = self.streams[name] = random.Random(self.stream_seed(name))
+        return rng
+
+    def stream_seed(self, name):
+        if self.resumed_at is None:
+            return f"{self.seed}/{name}"
+        return f"{self.seed}@{self.resumed_at}/{name}"
+
+    def resume(self, turn):
+        """
+        Reseed every stream, in place, for a game resumed at turn. A snapshot
+        doesn't keep the state of the streams, so the rest of a resumed game
+        is the same every time it's resumed from that snapshot, but not the
+        same as the game that was saved would have gone on to be
+        """
+        self.resumed_at = turn
+        for name, rng in self.streams.items():
+            rng.seed(self.stream_seed(name))
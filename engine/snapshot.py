@@ -0,0 +1,157 @@
+# Compact binary snapshots of a game between turns, small enough to save every
+# turn: where the pieces are, the hands, the envelope, the notesheets, whose
+# turn it is and what every AI has worked out, packed with struct
+import struct
+
+from engine.board import get_topology
+from engine.deduction import Deduction, CARD_IDS, CARD_VALUES
+from engine.eventlog import event_log
+from engine.game import Game, STARTING_POSITIONS
+from engine.notes import CARD_COUNT
+
+MAGIC = b"CLUE"
+VERSION = 1
+
+# Magic, version, number of players, whether seat 0 is a human, seed, turns
+# played, seat whose turn it is and the seat that won (NONE if nobody has)
+HEADER = struct.Struct("<4sBBBqIBB")
+
+# An AI's goal square and room, whether it's ready to accuse and what with,
+# and how many deduction clauses follow
+AI_STATE = struct.Struct("<BBBB3BH")
+CLAUSE = struct.Struct("<BI")
+
+# What every owner (each seat and the envelope) is known to have, then to lack
+MASK = struct.Struct("<I")
+
+# Stands in for a missing seat, room or card
+NONE = 0xFF
+
+CHARACTERS = list(STARTING_POSITIONS)
+
+
+def snapshot_game(game):
+    """
+    Pack the state of a game between turns into bytes.
+    The spaces left to move and the AIs' planned paths aren't kept, they're
+    worked out again on the next turn
+    """
+    human = game.human is not None
+    winner = NONE if game.winner is None else game.winner
+    parts = [HEADER.pack(MAGIC, VERSION, game.num_players, human, game.random.seed, game.turn_count,
+                         game.current_seat(), winner)]
+
+    # Every piece on the board, playing or not, in starting position order
+    parts.append(bytes(coordinate for character in CHARACTERS
+                       for coordinate in game.board.player_locations[character]))
+    parts.append(bytes(CHARACTERS.index(player.character_name) for player in game.players))
+
+    # The envelope, then every hand in the order its cards are shown
+    parts.append(bytes(CARD_IDS[card.value] for card in game.killer))
+    for hand in game.all_decks:
+        parts.append(bytes([len(hand)] + [CARD_IDS[card.value] for card in hand]))
+
+    # Every seat's notesheet row, then for the AIs what they've worked out
+    room_names = get_topology().room_names
+    for seat, player in enumerate(game.players):
+        parts.append(game.notes.sheet(seat))
+        if player is game.human:
+            continue
+
+        goal_row, goal_col, goal_room = player.goal or (NONE, NONE, None)
+        accuse_cards = [CARD_IDS[value] for value in player.accuse_cards] or [NONE] * 3
+        deduction = player.deduction
+        parts.append(AI_STATE.pack(goal_row, goal_col, room_names.index(goal_room) if goal_room else NONE,
+                                   player.ready_to_accuse, *accuse_cards, len(deduction.clauses)))
+        parts.append(struct.pack(f"<{2 * len(deduction.sizes)}I", *deduction.has, *deduction.lacks))
+        parts.extend(CLAUSE.pack(owner, mask) for owner, mask in deduction.clauses)
+    return b"".join(parts)
+
+
+def restore_game(data, game_class=Game):
+    """
+    Make a game of game_class from a snapshot.
+    The game is set up from the snapshot's seed, then everything that
+    happened since is put back from the snapshot. Its random streams are
+    reseeded for the turn it was saved at (see GameRandom.resume)
+    """
+    magic, version, num_players, human, seed, turn_count, seat, winner = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a game snapshot")
+    if version != VERSION:
+        raise ValueError(f"Can't read version {version} snapshots, only version {VERSION}")
+    offset = HEADER.size
+
+    locations = data[offset:offset + 2 * len(CHARACTERS)]
+    offset += len(locations)
+    characters = [CHARACTERS[index] for index in data[offset:offset + num_players]]
+    offset += num_players
+
+    game = game_class(characters[0] if human else None, num_players, seed)
+    if [player.character_name for player in game.players] != characters:
+        raise ValueError("The snapshot's seats don't match its seed, it was saved by another version of the game")
+    game.random.resume(turn_count)
+
+    # Put the dealt cards back in the snapshot's hands, keeping the same card
+    # objects (and sprites) and the lists the game already hands out
+    cards = {card.value: card for hand in game.all_decks + [game.killer] for card in hand}
+    game.killer[:] = [cards[CARD_VALUES[card_id]] for card_id in data[offset:offset + 3]]
+    offset += 3
+    for hand in game.all_decks:
+        size = data[offset]
+        hand[:] = [cards[CARD_VALUES[card_id]] for card_id in data[offset + 1:offset + 1 + size]]
+        offset += 1 + size
+
+    for index, character in enumerate(CHARACTERS):
+        game.board.move_piece(character, (locations[2 * index], locations[2 * index + 1]))
+    for player in game.players:
+        player.row, player.column = game.board.player_locations[player.character_name]
+        player.update_position()
+
+    game.turn_count = event_log.turn = turn_count
+    game.whose_turn[:] = [index == seat for index in range(num_players)]
+    if winner != NONE:
+        game.winner = winner
+        game.game_over = True
+
+    room_names = get_topology().room_names
+    hand_sizes = [len(hand) for hand in game.all_decks]
+    for seat, player in enumerate(game.players):
+        game.notes.sheet(seat)[:] = data[offset:offset + CARD_COUNT]
+        offset += CARD_COUNT
+        if player is game.human:
+            continue
+
+        goal_row, goal_col, goal_room, ready, *accuse_cards, clause_count = AI_STATE.unpack_from(data, offset)
+        offset += AI_STATE.size
+        player.goal = None if goal_room == NONE else (goal_row, goal_col, room_names[goal_room])
+        player.planner = None
+        player.ready_to_accuse = bool(ready)
+        player.accuse_cards = (tuple(CARD_VALUES[card_id] for card_id in accuse_cards)
+                               if accuse_cards[0] != NONE else [])
+
+        deduction = player.deduction = Deduction(hand_sizes)
+        owners = len(deduction.sizes)
+        masks = struct.unpack_from(f"<{2 * owners}I", data, offset)
+        offset += 2 * owners * MASK.size
+        deduction.has = list(masks[:owners])
+        deduction.lacks = list(masks[owners:])
+        deduction.clauses = [CLAUSE.unpack_from(data, offset + index * CLAUSE.size) for index in range(clause_count)]
+        offset += clause_count * CLAUSE.size
+    return game
+
+
+def save_game(game, file_name):
+    """
+    Save a snapshot of the game to a file, see snapshot_game
+    """
+    with open(file_name, "wb") as f:
+        f.write(snapshot_game(game))
+
+
+def resume_game(file_name, game_class=Game):
+    """
+    Resume a game saved with save_game
+    """
+    with open(file_name, "rb") as f:
+        return restore_game(f.read(), game_class)
@@ -1,8 +1,12 @@
 import arcade
 import arcade.gui
+import bisect
 import json
 import os
-from enum import Enum
+
+from engine.deduction import CARD_IDS
+from engine.notes import NotesheetBox, SECTIONS
+from profiler import profiler
 
 # Constants for layout
 SCREEN_WIDTH = 750
@@ -16,58 +20,17 @@ TEXT_AREA_HEIGHT = 200
 SAVE_FILE = "notesheet_state.json"
 AI_SAVE_FILE = "ai_notesheet_state.json"
 
-# Initialize list of names for suspects, weapons, and rooms
-SUSPECTS = ["Miss Scarlet", "Colonel Mustard", "Mrs. White", "Mr. Green", "Mrs. Peacock", "Professor Plum"]
-WEAPONS = ["Candlestick", "Knife", "Lead Pipe", "Revolver", "Rope", "Wrench"]
-ROOMS = ["Kitchen", "Ball Room", "Conservatory", "Dining Room", "Lounge", "Hall", "Study", "Library", "Billiard Room"]
-
-
-# Different notesheet states
-class NotesheetBox(Enum):
-    BLANK = 0
-    MARKED = 1
-    SUGGEST = 2
-    ACCUSE = 3
-
-    def next(self):
-        items = list(NotesheetBox)
-        value = items.index(self)
-        if value == len(items) - 1:
-            value = 0
-        else:
-            value += 1
-        return items[value]
-
-
 NOTESHEET_COLORS = {NotesheetBox.BLANK: arcade.color.LIGHT_GRAY,
                     NotesheetBox.MARKED: arcade.color.LIGHT_GREEN,
                     NotesheetBox.SUGGEST: arcade.color.ORANGE,
                     NotesheetBox.ACCUSE: arcade.color.RED}
 
 
-'''
-Done with help from Stack Overflow:
-https://stackoverflow.com/questions/24481852/serialising-an-enum-member-to-json/24482806#24482806
-'''
-class EnumEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if obj in NotesheetBox:
-            return {"__enum__": str(obj)}
-        return json.JSONEncoder.default(self, obj)
-
-
-def as_enum(d):
-    if "__enum__" in d:
-        name, member = d["__enum__"].split(".")
-        return NotesheetBox[member]
-    else:
-        return d
-
-
 class Notesheet(arcade.View):
-    def __init__(self, game_view, player_room, players_turn):
+    def __init__(self, game_view, player_room, players_turn, notes, seat=0):
         """
-        Initialize the Notesheet view and grid states
+        Initialize the Notesheet view of the sheet of a seat in the game's notes
+        (an engine.Notes), the other seats' sheets are the AIs'
         Load saved notesheet if available
         """
         super().__init__()
@@ -79,30 +42,8 @@ class Notesheet(arcade.View):
 
         self.players_turn = players_turn
 
-        self.grid_state = {
-            "Suspects": {suspect: NotesheetBox.BLANK for suspect in SUSPECTS},
-            "Weapons": {weapon: NotesheetBox.BLANK for weapon in WEAPONS},
-            "Rooms": {room: NotesheetBox.BLANK for room in ROOMS},
-        }
-
-        self.ai_grid_state_1 = {
-            "Suspects": {suspect: NotesheetBox.BLANK for suspect in SUSPECTS},
-            "Weapons": {weapon: NotesheetBox.BLANK for weapon in WEAPONS},
-            "Rooms": {room: NotesheetBox.BLANK for room in ROOMS},
-        }
-        self.ai_grid_state_2 = {
-            "Suspects": {suspect: NotesheetBox.BLANK for suspect in SUSPECTS},
-            "Weapons": {weapon: NotesheetBox.BLANK for weapon in WEAPONS},
-            "Rooms": {room: NotesheetBox.BLANK for room in ROOMS},
-        }
-        self.ai_grid_state_3 = {
-            "Suspects": {suspect: NotesheetBox.BLANK for suspect in SUSPECTS},
-            "Weapons": {weapon: NotesheetBox.BLANK for weapon in WEAPONS},
-            "Rooms": {room: NotesheetBox.BLANK for room in ROOMS},
-        }
-        print("DEFINING AI Notesheet!!!!")
-        print(self.ai_grid_state_1)
-        print()
+        self.notes = notes
+        self.seat = seat
 
         self.input_notes = "" # Store text area content
         self.setup()
@@ -199,6 +140,61 @@ class Notesheet(arcade.View):
             anchor_y="center"
         )
 
+        # Title and text area label, built once and only laid out again if their text changes
+        self.title_text = arcade.Text(
+            "Notesheet",
+            50,
+            SCREEN_HEIGHT - 25,
+            arcade.color.BLACK,
+            font_size=16,
+            anchor_x="center"
+        )
+        self.notes_label_text = arcade.Text(
+            "Enter notes here:",
+            50,
+            SCREEN_HEIGHT // 2 - 60,
+            arcade.color.BLACK,
+            font_size=12
+        )
+
+        self.layout_cells()
+
+        # Section titles and item names of the grid, each name to the left of its box
+        self.grid_texts = []
+        for section in SECTIONS:
+            start_x, start_y = self.get_grid_start_position(section)
+            self.grid_texts.append(arcade.Text(section, start_x, start_y, arcade.color.BLACK, 16, anchor_x="left"))
+        for (section, item), (cell_x, cell_y) in self.cell_layout.items():
+            self.grid_texts.append(arcade.Text(item, cell_x - 150, cell_y - 10, arcade.color.BLACK, 12, anchor_x="left"))
+
+        # Grid cells, one sprite per cell colored by its state so a click only
+        # updates that cell, drawn with the shapes that never change in one call each
+        self.cell_sprites = arcade.SpriteList()
+        self.cells = {}
+        self.static_shapes = arcade.ShapeElementList()
+        for (section, item), (cell_x, cell_y) in self.cell_layout.items():
+            cell = arcade.SpriteSolidColor(GRID_CELL_SIZE, GRID_CELL_SIZE, arcade.color.WHITE)
+            cell.position = cell_x, cell_y
+            self.cell_sprites.append(cell)
+            self.cells[(section, item)] = cell
+            self.static_shapes.append(arcade.create_rectangle_outline(
+                cell_x, cell_y, GRID_CELL_SIZE, GRID_CELL_SIZE, arcade.color.BLACK))
+        self.refresh_cells()
+
+        # Background of the color key
+        self.static_shapes.append(arcade.create_rectangle_filled(450, 200, 175, 200, arcade.color.BLACK))
+
+        # Border around the text area
+        border_padding = 5
+        self.static_shapes.append(arcade.create_rectangle_outline(
+            50 + TEXT_AREA_WIDTH // 2,
+            (SCREEN_HEIGHT // 2 - 275) + TEXT_AREA_HEIGHT // 2,
+            TEXT_AREA_WIDTH + border_padding,
+            TEXT_AREA_HEIGHT + border_padding,
+            arcade.color.BLACK,
+            border_width=2
+        ))
+
         popup_text_x = SCREEN_HEIGHT / 2
         popup_text_y = SCREEN_WIDTH / 2
         self.popup_text = arcade.Text(
@@ -219,28 +215,65 @@ class Notesheet(arcade.View):
         self.window.weapon = None
         self.window.room = None
 
-    def draw_grid_section(self, title, items, start_x, start_y):
+    def layout_cells(self):
         """
-        Draw a section of the notesheet grid with a title, list of items,
-        and toggleable boxes, which indicate whether each item is marked
+        Work out where every box of the grid goes, once. Drawing places the boxes
+        from cell_layout, and cell_at maps a click back to a box from the same
+        columns, so the two can't disagree
         """
-        # Draw section title
-        arcade.draw_text(title, start_x, start_y, arcade.color.BLACK, 16, anchor_x="left")
-        y_offset = start_y - 30
-        for item in items:
-            # Draw item name
-            arcade.draw_text(item, start_x, y_offset, arcade.color.BLACK, 12, anchor_x="left")
-
-            # Draw grid cell (toggle box) and fill based on state
+        # Center of the box of every (section, item)
+        self.cell_layout = {}
+
+        # Left edge, top edge and items of each section's column of boxes, left to right
+        columns = []
+        for section, items in SECTIONS.items():
+            start_x, start_y = self.get_grid_start_position(section)
             cell_x = start_x + 150
-            cell_y = y_offset + 10
-            color = NOTESHEET_COLORS[self.grid_state[title][item]]
-            arcade.draw_rectangle_filled(cell_x, cell_y, GRID_CELL_SIZE, GRID_CELL_SIZE, color)
-            arcade.draw_rectangle_outline(cell_x, cell_y, GRID_CELL_SIZE, GRID_CELL_SIZE, arcade.color.BLACK)
+            cell_y = start_y - 20
+            for index, item in enumerate(items):
+                self.cell_layout[(section, item)] = cell_x, cell_y - index * (GRID_CELL_SIZE + GRID_MARGIN)
+            columns.append((cell_x - GRID_CELL_SIZE / 2, cell_y + GRID_CELL_SIZE / 2, section, list(items)))
+        columns.sort(key=lambda column: column[0])
+        self.column_lefts = [column[0] for column in columns]
+        self.columns = columns
+
+    def cell_at(self, x, y):
+        """
+        Return the (section, item) of the box x, y is inside, or None
+        """
+        # The column is the last one starting left of x, the row is how many
+        # boxes and margins down from the top of the column y is
+        index = bisect.bisect_right(self.column_lefts, x) - 1
+        if index < 0:
+            return None
+        left, top, section, items = self.columns[index]
+        row, inside = divmod(top - y, GRID_CELL_SIZE + GRID_MARGIN)
+        if 0 < x - left < GRID_CELL_SIZE and 0 < inside < GRID_CELL_SIZE and 0 <= row < len(items):
+            return section, items[int(row)]
+        return None
+
+    def refresh_cell(self, section, item):
+        """
+        Color the box of one item of the grid by its state
+        """
+        self.cells[(section, item)].color = NOTESHEET_COLORS[self.notes.get(self.seat, CARD_IDS[item])]
 
-            y_offset -= GRID_CELL_SIZE + GRID_MARGIN
+    def refresh_cells(self):
+        """
+        Color every box of the grid, after the whole sheet is replaced
+        """
+        for section, item in self.cells:
+            self.refresh_cell(section, item)
 
     def on_draw(self):
+        with profiler.measure("draw"):
+            self.draw_sheet()
+
+        # Draw the frame time graph over the sheet if it's turned on in the game
+        profiler.draw()
+        profiler.end_frame()
+
+    def draw_sheet(self):
         """
         Render the Notesheet view
         """
@@ -248,47 +281,21 @@ class Notesheet(arcade.View):
         arcade.set_background_color(arcade.color.ANTIQUE_BRASS)
 
         # Draw the title at the top of the view
-        arcade.draw_text(
-            text="Notesheet",
-            start_x=50,
-            start_y=SCREEN_HEIGHT - 25,
-            color=arcade.color.BLACK,
-            font_size=16,
-            anchor_x="center"
-        )
+        self.title_text.draw()
 
-        # Draw Suspects, Weapons, and Rooms sections
-        self.draw_grid_section("Suspects", SUSPECTS, 50, SCREEN_HEIGHT - 50)
-        self.draw_grid_section("Weapons", WEAPONS, 300, SCREEN_HEIGHT - 50)
-        self.draw_grid_section("Rooms", ROOMS, 550, SCREEN_HEIGHT - 50)
+        # Draw Suspects, Weapons, and Rooms sections, then the cell outlines,
+        # the color key background and the text area border
+        self.cell_sprites.draw()
+        self.static_shapes.draw()
+        for text in self.grid_texts:
+            text.draw()
 
-        arcade.draw_rectangle_filled(450, 200,
-                                     175, 200, arcade.color.BLACK)
         self.mark_text.draw()
         self.suggest_text.draw()
         self.accuse_text.draw()
-        
-        # Draw a border around the text area
-        text_area_x = 50 + TEXT_AREA_WIDTH // 2
-        text_area_y = (SCREEN_HEIGHT // 2 - 275) + TEXT_AREA_HEIGHT // 2
-        border_padding = 5
-        arcade.draw_rectangle_outline(
-            center_x=text_area_x,
-            center_y=text_area_y,
-            width=TEXT_AREA_WIDTH + border_padding,
-            height=TEXT_AREA_HEIGHT + border_padding,
-            color=arcade.color.BLACK,
-            border_width=2  
-        )
 
-    # Draw label above the text area
-        arcade.draw_text(
-            text="Enter notes here:",
-            start_x=50,  
-            start_y=SCREEN_HEIGHT // 2 - 60,
-            color=arcade.color.BLACK,
-            font_size=12
-        )
+        # Draw label above the text area
+        self.notes_label_text.draw()
         
         # Draw manager elements
         self.manager.draw()
@@ -316,16 +323,12 @@ class Notesheet(arcade.View):
         if self.popup_enabled:
             self.popup_enabled = False
         else:
-            # Check if the click is within any grid cell and toggle its state
-            for section, items in self.grid_state.items():
-                start_x, start_y = self.get_grid_start_position(section)
-                for index, item in enumerate(items):
-                    cell_x = start_x + 150
-                    cell_y = start_y - 30 - index * (GRID_CELL_SIZE + GRID_MARGIN) + 10
-                    if (cell_x - GRID_CELL_SIZE / 2 < x < cell_x + GRID_CELL_SIZE / 2 and
-                        cell_y - GRID_CELL_SIZE / 2 < y < cell_y + GRID_CELL_SIZE / 2):
-                        # Toggle the state of the grid cell
-                        self.grid_state[section][item] = self.grid_state[section][item].next()
+            # Check if the click is within a grid cell and toggle its state
+            cell = self.cell_at(x, y)
+            if cell is not None:
+                section, item = cell
+                self.notes.cycle(self.seat, CARD_IDS[item])
+                self.refresh_cell(section, item)
 
     def get_grid_start_position(self, section):
         """
@@ -353,9 +356,9 @@ class Notesheet(arcade.View):
     def validate_guess(self, method):
         guess = ['Suspects', 'Weapons', 'Rooms']
         valid_guess = True
-        for section, items in self.grid_state.items():
-            for card, value in items.items():
-                if value.name == method:
+        for section, items in SECTIONS.items():
+            for card in items:
+                if self.notes.get(self.seat, CARD_IDS[card]).name == method:
                     if section in guess:
                         guess[guess.index(section)] = card
                     else:
@@ -407,61 +410,39 @@ class Notesheet(arcade.View):
         # Update custom notes from the text area
         self.custom_notes = self.text_area.text
 
-        # Create dictionaries for saving
+        # Create dictionaries for saving, each sheet as the hex of its row of boxes
         notes_data = {
-            "grid_state": self.grid_state,
+            "grid_state": self.notes.sheet(self.seat).hex(),
             "custom_notes": self.custom_notes
         }
 
-        ai_notes_data = {
-            "grid_state_1": self.ai_grid_state_1,
-            "grid_state_2": self.ai_grid_state_2,
-            "grid_state_3": self.ai_grid_state_3
-        }
+        ai_notes_data = {f"grid_state_{seat}": self.notes.sheet(seat).hex()
+                         for seat in range(self.notes.num_sheets) if seat != self.seat}
 
         # Write to the JSON file
-        with open(SAVE_FILE, "w") as f:
-            json.dump(notes_data, f, cls=EnumEncoder)
+        with profiler.measure("json"):
+            with open(SAVE_FILE, "w") as f:
+                json.dump(notes_data, f)
 
-        # Write to the AI JSON file
-        with open(AI_SAVE_FILE, "w") as f2:
-            json.dump(ai_notes_data, f2, cls=EnumEncoder)
+            # Write a snapshot of the AIs' notes to the AI JSON file, the AIs
+            # themselves only ever read their notes from memory
+            with open(AI_SAVE_FILE, "w") as f2:
+                json.dump(ai_notes_data, f2)
 
     def load_notes(self):
         """
         Load the notesheet state from a JSON file, if it exists.
         """
         if os.path.exists(SAVE_FILE):
-            with open(SAVE_FILE, "r") as f:
-                notes_data = json.load(f, object_hook=as_enum)
-                self.grid_state = notes_data.get("grid_state", self.grid_state)
-                self.custom_notes = notes_data.get("custom_notes", "")
-                
-                # Set the loaded notes in the text area
-                self.text_area.text = self.custom_notes
-
-        # Do the same thing for the AI note sheets
-        if os.path.exists(AI_SAVE_FILE):
-            with open(AI_SAVE_FILE, "r") as f2:
-                notes_data = json.load(f2, object_hook=as_enum)
-                self.ai_grid_state_1 = notes_data.get("grid_state_1", self.ai_grid_state_1)
-                self.ai_grid_state_2 = notes_data.get("grid_state_2", self.ai_grid_state_2)
-                self.ai_grid_state_3 = notes_data.get("grid_state_3", self.ai_grid_state_3)
-
-    # When initializing ai cards mark the cards in the AI's notesheet (+ create notesheet)
-    def set_ai_cards(self, deck1, deck2, deck3):
-        print("\n1")
-        for card in deck1:
-            print(card.value)
-            self.ai_grid_state_1[card.card_type][card.value] = self.ai_grid_state_1[card.card_type][card.value].MARKED
-        print("\n2")
-        for card in deck2:
-            print(card.value)
-            self.ai_grid_state_2[card.card_type][card.value] = self.ai_grid_state_2[card.card_type][card.value].MARKED
-        print("\n3")
-        for card in deck3:
-            print(card.value)
-            self.ai_grid_state_3[card.card_type][card.value] = self.ai_grid_state_3[card.card_type][card.value].MARKED
+            with profiler.measure("json"), open(SAVE_FILE, "r") as f:
+                notes_data = json.load(f)
+            if "grid_state" in notes_data:
+                self.notes.sheet(self.seat)[:] = bytes.fromhex(notes_data["grid_state"])
+            self.refresh_cells()
+            self.custom_notes = notes_data.get("custom_notes", "")
+
+            # Set the loaded notes in the text area
+            self.text_area.text = self.custom_notes
 
     def update_notesheet(self, player_turn, player_room):
         """
@@ -471,65 +452,11 @@ class Notesheet(arcade.View):
         self.player_room = player_room
         self.load_notes()
 
-    def get_ai_notesheet(self, ai_num):
+    def get_ai_notesheet(self, seat):
         """
-        Return specified AI note sheet data
-        """
-        if ai_num == 1:
-            return self.ai_grid_state_1
-        elif ai_num == 2:
-            return self.ai_grid_state_2
-        elif ai_num == 3:
-            return self.ai_grid_state_3
-        else:
-            print("can't return ai note sheet because ai num isn't valid (1-3)")
-
-    def update_refute_card(self, refute_card, ai_num):
+        Return the row of boxes of the AI in a seat, indexed by card id
         """
-        When an AI's guess is refuted, update it here
-        """
-        if ai_num == 1:
-            self.ai_grid_state_1[refute_card.card_type][refute_card.value] = \
-                self.ai_grid_state_1[refute_card.card_type][refute_card.value].MARKED
-        elif ai_num == 2:
-            self.ai_grid_state_2[refute_card.card_type][refute_card.value] = \
-                self.ai_grid_state_2[refute_card.card_type][refute_card.value].MARKED
-        elif ai_num == 3:
-            print(f"refute card: {refute_card.value}")
-            self.ai_grid_state_3[refute_card.card_type][refute_card.value] = \
-                self.ai_grid_state_3[refute_card.card_type][refute_card.value].MARKED
-        else:
-            print("can't update ai note sheet because ai num isn't valid (1-3)")
-        self.save_notes()
-
-    def update_accusation(self, accuse_cards, ai_num):
-        """
-        When an AI's made an un-refuted guess, mark those cards as ACCUSE
-        """
-        if ai_num == 1:
-            self.ai_grid_state_1["Suspects"][accuse_cards[0]] = \
-                self.ai_grid_state_1["Suspects"][accuse_cards[0]].ACCUSE
-            self.ai_grid_state_1["Rooms"][accuse_cards[1]] = \
-                self.ai_grid_state_1["Rooms"][accuse_cards[1]].ACCUSE
-            self.ai_grid_state_1["Weapons"][accuse_cards[2]] = \
-                self.ai_grid_state_1["Weapons"][accuse_cards[2]].ACCUSE
-        elif ai_num == 2:
-            self.ai_grid_state_2["Suspects"][accuse_cards[0]] = \
-                self.ai_grid_state_2["Suspects"][accuse_cards[0]].ACCUSE
-            self.ai_grid_state_2["Rooms"][accuse_cards[1]] = \
-                self.ai_grid_state_2["Rooms"][accuse_cards[1]].ACCUSE
-            self.ai_grid_state_2["Weapons"][accuse_cards[2]] = \
-                self.ai_grid_state_2["Weapons"][accuse_cards[2]].ACCUSE
-        elif ai_num == 3:
-            self.ai_grid_state_3["Suspects"][accuse_cards[0]] = \
-                self.ai_grid_state_3["Suspects"][accuse_cards[0]].ACCUSE
-            self.ai_grid_state_3["Rooms"][accuse_cards[1]] = \
-                self.ai_grid_state_3["Rooms"][accuse_cards[1]].ACCUSE
-            self.ai_grid_state_3["Weapons"][accuse_cards[2]] = \
-                self.ai_grid_state_3["Weapons"][accuse_cards[2]].ACCUSE
-        else:
-            print("can't set accusation cards because ai num isn't valid (1-3)")
-        self.save_notes()
+        return self.notes.sheet(seat)
 
     def show_ai_suggestion(self, guess):
         """
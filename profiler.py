@@ -0,0 +1,158 @@
+# Per-frame timings of the game's subsystems, kept for the last few seconds
+# of frames and drawn as a graph over the game to see where the time goes
+import csv
+import time
+from array import array
+from contextlib import contextmanager
+
+import arcade
+
+from engine.eventlog import event_log
+
+# Subsystems timed each frame and the color of each in the graph
+SUBSYSTEMS = ("draw", "update", "ai", "json", "textures")
+SUBSYSTEM_COLORS = (arcade.color.SKY_BLUE, arcade.color.LIGHT_GREEN, arcade.color.ORANGE,
+                    arcade.color.YELLOW, arcade.color.PINK)
+
+# Number of frames kept, 4 seconds at 60 frames a second
+CAPACITY = 240
+
+# File the samples are dumped to
+CSV_FILE = "frame_times.csv"
+
+# Graph position and size, and the height of one 60 fps frame (16.7 ms) in it
+GRAPH_LEFT = 10
+GRAPH_BOTTOM = 60
+GRAPH_HEIGHT = 100
+FRAME_BUDGET = 1 / 60
+PIXELS_PER_SECOND = GRAPH_HEIGHT / (2 * FRAME_BUDGET)
+
+
+class FrameProfiler:
+    def __init__(self, capacity=CAPACITY):
+        """
+        Keep the time each subsystem took in the last capacity frames, in a
+        ring buffer per subsystem that's written over from the oldest frame
+        """
+        self.capacity = capacity
+        self.samples = {name: array("d", [0.0]) * capacity for name in SUBSYSTEMS}
+        self.frames = 0
+
+        # Time taken by each subsystem so far this frame
+        self.current = dict.fromkeys(SUBSYSTEMS, 0.0)
+
+        # Nothing is timed until the overlay is turned on
+        self.enabled = False
+        self.summary_text = None
+
+    def toggle(self):
+        """
+        Turn timing and the overlay on or off, starting from no samples each time it's turned on
+        """
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.frames = 0
+            self.current = dict.fromkeys(SUBSYSTEMS, 0.0)
+
+    @contextmanager
+    def measure(self, name):
+        """
+        Add the time the block takes to a subsystem's time this frame.
+        Only call from the thread that draws
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[name] += time.perf_counter() - start
+
+    def end_frame(self):
+        """
+        Record the subsystems' times this frame in the ring buffer and start the next frame
+        """
+        if not self.enabled:
+            return
+        index = self.frames % self.capacity
+        for name, seconds in self.current.items():
+            self.samples[name][index] = seconds
+            self.current[name] = 0.0
+        self.frames += 1
+
+        # Refresh the averages twice a second, text is slow to lay out every frame
+        if self.frames % 30 == 0:
+            self.update_summary()
+
+    def recorded(self):
+        """
+        Return the indices into the ring buffer of the frames kept, oldest first
+        """
+        count = min(self.frames, self.capacity)
+        first = self.frames - count
+        return [frame % self.capacity for frame in range(first, self.frames)]
+
+    def averages(self):
+        """
+        Return the average time of each subsystem over the frames kept, in seconds
+        """
+        indices = self.recorded()
+        if not indices:
+            return dict.fromkeys(SUBSYSTEMS, 0.0)
+        return {name: sum(samples[index] for index in indices) / len(indices)
+                for name, samples in self.samples.items()}
+
+    def update_summary(self):
+        text = "  ".join(f"{name} {seconds * 1000:.1f}" for name, seconds in self.averages().items()) + " ms"
+        if self.summary_text is None:
+            self.summary_text = arcade.Text(text, GRAPH_LEFT, GRAPH_BOTTOM + GRAPH_HEIGHT + 5,
+                                            arcade.color.WHITE, font_size=10)
+        else:
+            self.summary_text.text = text
+
+    def draw(self):
+        """
+        Draw the frames kept as stacked bars, one pixel wide and newest on the
+        right, with a line at the time of one 60 fps frame
+        """
+        if not self.enabled:
+            return
+        arcade.draw_lrtb_rectangle_filled(GRAPH_LEFT, GRAPH_LEFT + self.capacity,
+                                          GRAPH_BOTTOM + GRAPH_HEIGHT, GRAPH_BOTTOM, (0, 0, 0, 160))
+
+        # One batch of lines per subsystem, each bar starts where the one below it ended
+        indices = self.recorded()
+        bottoms = [GRAPH_BOTTOM] * len(indices)
+        for name, color in zip(SUBSYSTEMS, SUBSYSTEM_COLORS):
+            samples = self.samples[name]
+            points = []
+            for x, index in enumerate(indices):
+                top = min(bottoms[x] + samples[index] * PIXELS_PER_SECOND, GRAPH_BOTTOM + GRAPH_HEIGHT)
+                if top - bottoms[x] >= 1:
+                    points.append((GRAPH_LEFT + x, bottoms[x]))
+                    points.append((GRAPH_LEFT + x, top))
+                bottoms[x] = top
+            if points:
+                arcade.draw_lines(points, color)
+
+        budget_y = GRAPH_BOTTOM + FRAME_BUDGET * PIXELS_PER_SECOND
+        arcade.draw_line(GRAPH_LEFT, budget_y, GRAPH_LEFT + self.capacity, budget_y, arcade.color.RED)
+        if self.summary_text is not None:
+            self.summary_text.draw()
+
+    def dump_csv(self, file_name=CSV_FILE):
+        """
+        Write the frames kept to a CSV file, oldest first, with each subsystem's time in milliseconds
+        """
+        with open(file_name, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + tuple(f"{name}_ms" for name in SUBSYSTEMS))
+            first = self.frames - min(self.frames, self.capacity)
+            for frame, index in enumerate(self.recorded(), first):
+                writer.writerow([frame] + [f"{self.samples[name][index] * 1000:.3f}" for name in SUBSYSTEMS])
+        event_log.info("profiler", "dump", file=file_name, frames=min(self.frames, self.capacity))
+
+
+# Profiler shared by the views, the notesheet and the texture registry
+profiler = FrameProfiler()
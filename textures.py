@@ -0,0 +1,261 @@
+# A process-wide registry so textures are loaded from disk once and sprites
+# only swap between already loaded textures
+import os
+import queue
+import threading
+import xml.etree.ElementTree as ElementTree
+
+import arcade
+import PIL.Image
+
+import engine
+from profiler import profiler
+
+BOARD_IMAGE = "assets/ClueBoard.jpeg"
+CARD_BACK_IMAGE = r"assets/clue cards/cardBack.png"
+CARD_DIRECTORY = "assets/clue cards"
+DICE_DIRECTORY = "assets/board game pieces/PNG/Dice"
+SHEET_DIRECTORY = "assets/board game pieces/Spritesheets"
+
+# Sheet of the card art and the pieces, made by build_atlases.py
+GAME_SHEET = "assets/gameSheet.xml"
+
+# Piece sprite for each character
+PIECE_IMAGES = {
+    "Miss Scarlet": "assets/board game pieces/PNG/Pieces (Red)/pieceRed_border00.png",
+    "Colonel Mustard": "assets/board game pieces/PNG/Pieces (Yellow)/pieceYellow_border18.png",
+    "Mrs. White": "assets/board game pieces/PNG/Pieces (White)/pieceWhite_border00.png",
+    "Mr. Green": "assets/board game pieces/PNG/Pieces (Green)/pieceGreen_border00.png",
+    "Mrs. Peacock": "assets/board game pieces/PNG/Pieces (Blue)/pieceBlue_border01.png",
+    "Professor Plum": "assets/board game pieces/PNG/Pieces (Purple)/piecePurple_border00.png"
+}
+
+
+def card_image(value):
+    """Return the image file for the card with the given value"""
+    return f"{CARD_DIRECTORY}/{value.lower().replace(' ', '').replace('.', '')}.png"
+
+
+def die_image(value):
+    """Return the image file for the given face of the die"""
+    return f"{DICE_DIRECTORY}/dieWhite_border{value}.png"
+
+
+def read_sheet(descriptor):
+    """
+    Read a TextureAtlas XML descriptor and return the sheet image it describes
+    and the (x, y, width, height) of every image on it by name.
+    The sheet is the PNG with the same name as the descriptor, the bundled
+    descriptors all say sheet.png
+    """
+    regions = {}
+    for sub_texture in ElementTree.parse(descriptor).getroot().iter("SubTexture"):
+        regions[sub_texture.get("name")] = tuple(int(sub_texture.get(key)) for key in ("x", "y", "width", "height"))
+    return os.path.splitext(descriptor)[0] + ".png", regions
+
+
+class TextureRegistry:
+    def __init__(self):
+        """
+        Create an empty registry, counting how often a texture was already
+        loaded (hits) and how often it had to be loaded from disk (misses)
+        """
+        self.textures = {}
+        self.hits = 0
+        self.misses = 0
+
+        # Descriptor of the sheet the images under each directory are cut from, and
+        # the image and regions of the sheets read so far
+        self.sheets = {}
+        self.open_sheets = {}
+
+        # Number of files read from disk
+        self.opened = 0
+
+        # Images can be read on a preloading thread while the game reads them too
+        self.lock = threading.Lock()
+
+    def add_sheet(self, descriptor, directory):
+        """
+        Cut the images under a directory out of one sheet, named on it by
+        their path from the directory, instead of loading them file by file.
+        The sheet is read the first time one of them is asked for, images
+        that aren't on it are still loaded from their file
+        """
+        self.sheets[directory] = descriptor
+
+    def get(self, file_name):
+        """
+        Return the texture for an image file, loading it the first time it's asked for
+        """
+        texture = self.textures.get(file_name)
+        if texture is None:
+            self.misses += 1
+            texture = self.load(file_name)
+        else:
+            self.hits += 1
+        return texture
+
+    def load(self, file_name):
+        with profiler.measure("textures"):
+            return self.add_image(file_name, self.read_image(file_name))
+
+    def add_image(self, file_name, image):
+        """
+        Make the texture of an image that was already read, unless the file is already loaded
+        """
+        texture = self.textures.get(file_name)
+        if texture is None:
+            # Cards and dice are rectangles, and the pieces are only ever clicked through the
+            # cards on top, so skip working out a hit box from the pixels
+            texture = self.textures[file_name] = arcade.Texture(file_name, image=image, hit_box_algorithm="None")
+        return texture
+
+    def read_image(self, file_name):
+        """
+        Return the image of a file, cut out of its sheet if it's on one.
+        Safe to call from any thread
+        """
+        # Look on the sheet of the deepest directory first, the die's sheet before the game sheet
+        for directory in sorted(self.sheets, key=len, reverse=True):
+            if file_name.startswith(directory + "/"):
+                sheet, regions = self.open_sheet(directory)
+                region = regions.get(file_name[len(directory) + 1:])
+                if region is not None:
+                    x, y, width, height = region
+                    return sheet.crop((x, y, x + width, y + height))
+
+        image = PIL.Image.open(file_name).convert("RGBA")
+        with self.lock:
+            self.opened += 1
+        return image
+
+    def open_sheet(self, directory):
+        """
+        Return the image and the regions of the sheet of a directory, reading
+        them from disk the first time
+        """
+        with self.lock:
+            sheet = self.open_sheets.get(directory)
+            if sheet is None:
+                image_file, regions = read_sheet(self.sheets[directory])
+                sheet = self.open_sheets[directory] = PIL.Image.open(image_file).convert("RGBA"), regions
+                self.opened += 2
+        return sheet
+
+    def preload(self, file_names):
+        """
+        Load every texture that isn't loaded yet, without counting them as misses
+        """
+        for file_name in file_names:
+            if file_name not in self.textures:
+                self.load(file_name)
+
+    def stats(self):
+        """
+        Return the number of cache hits, misses, textures loaded and files read
+        """
+        return {"hits": self.hits, "misses": self.misses, "loaded": len(self.textures), "opened": self.opened}
+
+
+def add_game_sheets(textures):
+    """
+    Cut the die out of its bundled sheet, and the cards and pieces out of the game sheet
+    """
+    textures.add_sheet(f"{SHEET_DIRECTORY}/diceWhite_border.xml", DICE_DIRECTORY)
+    textures.add_sheet(GAME_SHEET, "assets")
+
+
+# Registry shared by every sprite in the process
+registry = TextureRegistry()
+add_game_sheets(registry)
+
+
+class TexturePreloader:
+    def __init__(self, textures, file_names):
+        """
+        Read the images of file_names into the registry textures on a
+        background thread, skipping those it already has
+        """
+        self.textures = textures
+        self.file_names = [file_name for file_name in file_names if file_name not in textures.textures]
+        self.loaded = 0
+
+        # Images the thread has read, waiting to be made into textures
+        self.finished = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self.read_images, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def read_images(self):
+        for file_name in self.file_names:
+            self.finished.put((file_name, self.textures.read_image(file_name)))
+
+    def collect(self):
+        """
+        Make textures of the images read so far. Call from the thread that
+        draws, the registry is only ever changed there
+        """
+        while True:
+            try:
+                file_name, image = self.finished.get_nowait()
+            except queue.Empty:
+                return
+            with profiler.measure("textures"):
+                self.textures.add_image(file_name, image)
+            self.loaded += 1
+
+    def finish(self):
+        """
+        Wait for the rest of the images and make their textures
+        """
+        self.thread.join()
+        self.collect()
+
+    @property
+    def progress(self):
+        """
+        Return the fraction of the images loaded so far, from 0 to 1
+        """
+        if not self.file_names:
+            return 1.0
+        return self.loaded / len(self.file_names)
+
+
+def game_texture_files():
+    """
+    Return every image file a game shows, the characters' cards first for
+    the selection screen, then the rest of the cards, the board, the pieces
+    and the six die faces
+    """
+    card_values = engine.SUSPECT_CARD_VALUES + engine.WEAPON_CARD_VALUES + engine.ROOM_CARD_VALUES
+    return ([card_image(value) for value in card_values] + [CARD_BACK_IMAGE, BOARD_IMAGE]
+            + list(PIECE_IMAGES.values()) + [die_image(value) for value in range(1, 7)])
+
+
+# Preloader of the game's textures, started when the first screen is shown
+preloader = None
+
+
+def start_preloading():
+    """
+    Start reading every texture a game shows in the background, once, and
+    return the preloader doing it
+    """
+    global preloader
+    if preloader is None:
+        preloader = TexturePreloader(registry, game_texture_files())
+        preloader.start()
+    return preloader
+
+
+def preload_game_textures():
+    """
+    Load every texture a game shows, the cards, die, board and pieces, so
+    flips and rolls never hit the disk. Textures still being read in the
+    background are waited for
+    """
+    if preloader is not None:
+        preloader.finish()
+    registry.preload(game_texture_files())
@@ -0,0 +1,84 @@
+import argparse
+import functools
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import engine
+
+# Games that go on longer than this are stopped and counted as unfinished
+DEFAULT_MAX_TURNS = 2000
+
+
+def play_game(seed, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Play one headless game with an AI in every seat.
+    Returns the winner's character name and seat (None if nobody accused
+    within max_turns) and the number of turns played.
+    """
+    # Keep the workers quiet, tracing off costs a call per event
+    engine.event_log.set_level(engine.OFF)
+    game = engine.Game(seed=seed)
+    winner = game.run(max_turns)
+
+    if winner is None:
+        return None, None, game.turn_count
+    return game.players[winner].character_name, winner, game.turn_count
+
+
+def run_tournament(num_games, seed=0, workers=None, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Play num_games games across a pool of worker processes.
+    Game i is seeded with seed + i, so a tournament plays the same games
+    whatever the number of workers.
+    Returns the result of every game, in order.
+    """
+    seeds = range(seed, seed + num_games)
+    chunksize = max(1, num_games // ((workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(functools.partial(play_game, max_turns=max_turns), seeds, chunksize=chunksize))
+
+
+def report(results, elapsed):
+    """
+    Print win rates, average turns to an accusation and throughput
+    """
+    finished = [result for result in results if result[0] is not None]
+    wins_by_character = Counter(character for character, _, _ in finished)
+    wins_by_seat = Counter(seat for _, seat, _ in finished)
+
+    print(f"Games played: {len(results)} ({len(results) - len(finished)} unfinished)")
+    print(f"Games/sec: {len(results) / elapsed:.2f}")
+    if finished:
+        average_turns = sum(turns for _, _, turns in finished) / len(finished)
+        print(f"Average turns to accusation: {average_turns:.1f}")
+
+    print("\nWin rate by character:")
+    for character in engine.STARTING_POSITIONS:
+        print(f"  {character:<16}{wins_by_character[character] / len(results):>8.1%}")
+
+    print("\nWin rate by seat:")
+    for seat in sorted(wins_by_seat):
+        print(f"  Seat {seat:<11}{wins_by_seat[seat] / len(results):>8.1%}")
+
+
+def main():
+    """ Run a tournament of AI games from the command line """
+    parser = argparse.ArgumentParser(description="Play Computer AIs against each other without a window")
+    parser.add_argument("-n", "--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, game i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (defaults to the CPU count)")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS,
+                        help="turns after which a game is stopped as unfinished")
+    args = parser.parse_args()
+    if args.seed < engine.MIN_SEED or args.seed + args.games - 1 > engine.MAX_SEED:
+        parser.error(f"every game's seed must be between {engine.MIN_SEED} and {engine.MAX_SEED}")
+
+    start = time.perf_counter()
+    results = run_tournament(args.games, args.seed, args.workers, args.max_turns)
+    report(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()